@@ -0,0 +1,94 @@
+import pandas as pd
+import streamlit as st
+
+from utils import artifacts, instrument, sessions
+
+st.title(":stethoscope: Diagnostics")
+
+st.markdown("## :busts_in_silhouette: Sessions.")
+counts = sessions.counters()
+col1, col2, col3 = st.columns(3)
+col1.metric("Tracked sessions", counts["sessions"])
+col2.metric("Values spilled", counts["spills"])
+col3.metric("Values restored", counts["restores"])
+table = sessions.report()
+if table.empty:
+    st.write("No sessions tracked yet.")
+else:
+    st.dataframe(table, width="stretch")
+    if table["outlier"].any():
+        st.warning(
+            f"{table['outlier'].sum()} session(s) hold far more state than the "
+            "rest; see their largest key."
+        )
+st.caption(
+    f"Values over {sessions.SPILL_MIN_BYTES // 2**20} MB move to disk after "
+    f"{sessions.IDLE_SECONDS:.0f} s idle (SANDBOX_SESSION_IDLE)."
+)
+
+st.markdown("## :package: Stored models.")
+stored = [
+    {"model": name, **meta}
+    for name in artifacts.models()
+    for meta in artifacts.versions(name)
+]
+if not stored:
+    st.write("No models stored yet.")
+else:
+    models = pd.DataFrame(stored).drop(columns="params", errors="ignore")
+    models["created"] = pd.to_datetime(models["created"], unit="s")
+    st.dataframe(models, width="stretch")
+    st.caption(
+        "A model is trained again, as a new version, when its training data or "
+        "parameters change; older versions stay on disk."
+    )
+
+st.markdown("## :hourglass: Slowest reruns.")
+
+if not instrument.ENABLED:
+    st.info(
+        "Profiling is off. Start the app with `SANDBOX_PROFILE=1` to record "
+        "every page run."
+    )
+
+runs = instrument.load_runs()
+if not runs:
+    st.write("No reruns recorded yet.")
+    st.stop()
+
+summary = (
+    pd.DataFrame(runs)
+    .groupby("page")["seconds"]
+    .describe(percentiles=[0.5, 0.95])[["count", "50%", "95%", "max"]]
+    .sort_values("max", ascending=False)
+)
+st.dataframe(summary, width="stretch")
+
+page = st.selectbox("Page", summary.index)
+page_runs = [r for r in runs if r["page"] == page][:20]
+labels = [
+    f"{r['seconds'] * 1000:,.0f} ms, "
+    f"{pd.Timestamp(r['started'], unit='s'):%Y-%m-%d %H:%M:%S}"
+    for r in page_runs
+]
+index = st.selectbox(
+    "Rerun", range(len(page_runs)), format_func=labels.__getitem__
+)
+run = page_runs[index]
+
+if run["spans"]:
+    st.subheader("Spans")
+    st.dataframe(pd.DataFrame(run["spans"]), width="stretch")
+
+
+def tree_lines(node, depth=0):
+    yield f"{node['seconds'] * 1000:9.1f} ms {'  ' * depth}{node['name']}"
+    for child in node["children"]:
+        yield from tree_lines(child, depth + 1)
+
+
+st.subheader("Call tree")
+if run["tree"] is None:
+    st.write("No call tree: another rerun was being profiled at the same time.")
+else:
+    st.code("\n".join(tree_lines(run["tree"])), language=None)
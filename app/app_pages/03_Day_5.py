@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.charts import scatter_spec
+
+st.title("30 Days of Streamlit")
+st.markdown("### Day 5")
+st.header("st.write")
+
+st.write("Hello *world* :sunglasses:")
+st.write(1234)
+
+df = pd.DataFrame(
+    {"first column": [1, 2, 3, 4], "second column": [10, 20, 30, 40]}
+)
+st.write(df)
+
+st.write("Below is a DataFrame:", df, "Above is a dataframe.")
+
+
+@st.cache_data
+def load_data(rows):
+    return pd.DataFrame(np.random.randn(rows, 3), columns=["a", "b", "c"])
+
+
+# Large frames are binned or sampled on the server, so the chart spec stays
+# small however many rows there are.
+rows = st.select_slider("Rows", [200, 10_000, 100_000, 1_000_000], 200)
+method = st.radio("Reduce large data by", ["bin", "sample"], horizontal=True)
+df2 = load_data(rows)
+spec = scatter_spec(
+    df2, x="a", y="b", size="c", color="c", tooltip=["a", "b", "c"], method=method
+)
+st.vega_lite_chart(spec)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import sessions
+from utils.streaming import RingBuffer, SimulatedTelemetry, minmax_decimate, to_frame
+
+st.title("30 Days of Streamlit")
+st.markdown("### Day 9")
+
+st.header("Line chart")
+
+chart_data = pd.DataFrame(np.random.randn(20, 3), columns=["a", "b", "c"])
+
+st.line_chart(chart_data)
+
+st.header("Live streaming line chart")
+
+# A simulated telemetry source feeds a fixed-size ring buffer. Each tick
+# redraws only this fragment, from the buffer decimated to a fixed number of
+# points, so memory and per-update cost stay constant however long the stream
+# runs.
+
+if st.toggle("Stream telemetry"):
+    rate = st.slider("Points per second", 100, 10_000, 1_000, step=100)
+    window = st.select_slider("Window (points)", [1_000, 10_000, 100_000], 10_000)
+    decimate = st.toggle("Min/max decimation", True)
+    bins = 500 if decimate else window
+
+    state = st.session_state.get("telemetry")
+    if state is None or state["buffer"].capacity != window:
+        state = st.session_state.telemetry = {
+            "buffer": RingBuffer(window, ["a", "b", "c"]),
+            "source": SimulatedTelemetry(["a", "b", "c"], rate),
+        }
+    state["source"].rate = rate
+
+    @sessions.fragment(run_every=0.2)
+    def live_chart():
+        buffer, source = state["buffer"], state["source"]
+        buffer.extend(source.read(max_rows=buffer.capacity))
+        st.line_chart(to_frame(*minmax_decimate(*buffer.view(), bins), buffer.columns))
+
+    live_chart()
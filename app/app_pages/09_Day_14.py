@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+from utils import instrument, sessions, shared_data
+from utils.profile_report import ProfileJob, report_path, use_minimal
+
+st.title("30 Days of Streamlit")
+st.markdown("### Day 14")
+
+st.header("`streamlit_pandas_profiling`")
+
+
+# The frame is shared read-only by every session and by the profiling worker.
+def load_data(source, mtime):
+    return shared_data.dataset(
+        f"csv-{source}-{mtime}", lambda: pd.read_csv(source)
+    )
+
+
+# The dataset comes from server configuration only: PENGUINS_URL points the
+# page at another copy (a URL or a local file), never at user input.
+source = os.environ.get(
+    "PENGUINS_URL",
+    "https://raw.githubusercontent.com/dataprofessor/data/master/penguins_cleaned.csv",
+)
+# Local files are re-read whenever they change on disk.
+mtime = Path(source).stat().st_mtime if Path(source).is_file() else None
+try:
+    with instrument.span("load data"):
+        df = load_data(source, mtime)
+except Exception as e:
+    st.error(f"Could not load the dataset: {e}")
+    st.stop()
+
+mode = st.radio("Profiling mode", ["Auto", "Full", "Minimal"], horizontal=True)
+minimal = {"Auto": use_minimal(df), "Full": False, "Minimal": True}[mode]
+if minimal:
+    st.caption("Minimal mode: correlations and interactions are skipped.")
+
+# Profiling runs in a worker process; this page only polls its progress.
+job = st.session_state.get("profile_job")
+if job is None or job.path != report_path(df, minimal=minimal):
+    if job is not None:
+        job.cancel()
+    job = st.session_state.profile_job = ProfileJob(df, minimal=minimal)
+    job.start()
+
+
+@sessions.fragment(run_every=1)
+def show_progress():
+    status = job.status()
+    if job.done:
+        st.rerun()
+    st.progress(status["progress"], status["stage"])
+    if not job.running:
+        st.button("Restart", on_click=job.start)
+        return
+    st.button("Cancel", on_click=job.cancel)
+    partial = job.partial_html()
+    if partial is not None:
+        st.caption("Partial report; correlations and interactions to follow.")
+        components.html(partial, height=1000, scrolling=True)
+
+
+if job.done:
+    components.html(job.html(), height=1000, scrolling=True)
+else:
+    show_progress()
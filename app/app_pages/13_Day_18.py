@@ -0,0 +1,43 @@
+import streamlit as st
+
+from utils.uploads import load_csv_upload, upload_digest
+from utils.viewer import dataframe_viewer
+
+st.title("30 Days of Streamlit")
+st.markdown("### Day 18")
+
+st.header("st.file_uploader")
+st.subheader("Input CSV")
+uploaded_file = st.file_uploader("Choose a file")
+
+if uploaded_file is not None:
+    # The first upload of some content is parsed in chunks, showing a
+    # preview and running statistics; afterwards it is reopened from the
+    # local cache, memory-mapped.
+    progress = st.progress(0.0, "Parsing...")
+    preview = st.empty()
+    summary = st.empty()
+
+    def show_chunk(chunk, stats):
+        if stats.rows == len(chunk):
+            preview.write(chunk.head(1000))
+        summary.write(stats.describe())
+        progress.progress(
+            min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0),
+            f"{stats.rows:,} rows parsed",
+        )
+
+    df, describe = load_csv_upload(uploaded_file, on_chunk=show_chunk)
+    progress.empty()
+    preview.empty()
+    summary.empty()
+
+    st.subheader("DataFrame")
+    dataframe_viewer(
+        df, key="upload", version=upload_digest(uploaded_file), summary=describe
+    )
+    st.subheader("Descriptive Statitics")
+    st.write(describe)
+    st.caption("Quantiles are estimated from a random sample of 10,000 rows.")
+else:
+    st.info("Upload a CSV file")
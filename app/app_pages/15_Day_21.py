@@ -0,0 +1,54 @@
+import time
+
+import streamlit as st
+
+from utils import sessions
+from utils.tasks import reset_session_task, session_task
+
+st.title("30 Days of Streamlit")
+st.markdown("### Day 21")
+
+st.header("st.progress")
+
+with st.expander("About this app"):
+    st.write(
+        "You can now display the progress of you calclations in a Streamlit app with the `st.progress` command."
+    )
+
+
+def calculate(progress):
+    for percent_complete in range(100):
+        time.sleep(0.05)
+        progress((percent_complete + 1) / 100)
+    return "Calculation finished!"
+
+
+# The calculation runs on a shared worker pool, so it keeps going if you
+# navigate away; this page only renders its progress.
+task = session_task("day21_task", calculate)
+
+if "day21_task_result" in st.session_state:
+    st.progress(100)
+    st.success(st.session_state.day21_task_result)
+    if not st.session_state.get("day21_celebrated"):
+        st.session_state.day21_celebrated = True
+        st.balloons()
+    if st.button("Run again"):
+        reset_session_task("day21_task")
+        st.session_state.day21_celebrated = False
+        st.rerun()
+elif "day21_task_error" in st.session_state:
+    st.error(f"The calculation failed: {st.session_state.day21_task_error}")
+    if st.button("Try again"):
+        reset_session_task("day21_task")
+        st.rerun()
+else:
+
+    @sessions.fragment(run_every=0.2)
+    def show_progress():
+        if task.done():
+            st.rerun()
+        fraction, _ = task.progress()
+        st.progress(fraction)
+
+    show_progress()
@@ -0,0 +1,105 @@
+import queue
+
+import streamlit as st
+
+from utils import sessions
+from utils.orders import OrderQueue
+from utils.paths import cache_dir
+
+
+@st.cache_resource
+def get_orders():
+    return OrderQueue(cache_dir("orders") / "orders.db")
+
+
+st.title("30 Days of Streamlit")
+st.markdown("### Day 22")
+
+st.header("st.form")
+
+# Full example of using `with` notation
+st.header("1. Example of using `with` notation")
+st.subheader("Coffee machine")
+
+with st.form("my_form"):
+    st.subheader("**Order your coffee**")
+
+    # Input widgets
+    coffee_bean_val = st.selectbox("Coffee bean", ["Arabica", "Robusta"])
+    coffee_roast_val = st.selectbox("Coffee roast", ["Light", "Medium", "Dark"])
+    brewing_val = st.selectbox(
+        "Brewing method", ["Aeropress", "Drip", "French press", "Moka pot", "Siphon"]
+    )
+    serving_typeval = st.selectbox("Serving format", ["Hot", "Iced", "Frappe"])
+    milk_val = st.select_slider("Milk intensity", ["None", "Low", "Medium", "High"])
+    owncup_val = st.checkbox("Bring own cup")
+
+    # Every form must have a submit button
+    submitted = st.form_submit_button("Submit")
+
+# Submitting only queues the order; a background writer stores queued orders
+# in SQLite, many per commit.
+orders = get_orders()
+
+if submitted:
+    try:
+        ticket = orders.submit(
+            {
+                "bean": coffee_bean_val,
+                "roast": coffee_roast_val,
+                "brewing": brewing_val,
+                "serving": serving_typeval,
+                "milk": milk_val,
+                "own_cup": owncup_val,
+            }
+        )
+    except queue.Full:
+        st.error("Too many orders right now, please try again in a moment.")
+        st.stop()
+    st.session_state.day22_order = ticket
+    st.markdown(
+        f"""
+        :coffee: You have ordered:
+        - Coffee bean: `{coffee_bean_val}`
+        - Coffee roast: `{coffee_roast_val}`
+        - Brewing: `{brewing_val}`
+        - Serving type: `{serving_typeval}`
+        - Milk: `{milk_val}`
+        - Bring own cup: `{owncup_val}`
+        """
+    )
+else:
+    st.write("Place your order!")
+
+
+@sessions.fragment(run_every=1)
+def show_intake():
+    ticket = st.session_state.get("day22_order")
+    if ticket is not None:
+        stored = orders.is_written(ticket)
+        st.caption(f"Order #{ticket}: {'stored' if stored else 'queued'}")
+    metrics = orders.metrics()
+    if metrics["last_error"]:
+        st.warning(f"Storing orders failed, retrying: {metrics['last_error']}")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Orders / s", f"{metrics['orders_per_second']:,.1f}")
+    col2.metric("Latency p50", f"{metrics['p50_ms']:,.1f} ms")
+    col3.metric("Latency p99", f"{metrics['p99_ms']:,.1f} ms")
+    col4.metric("Queued", metrics["pending"])
+    st.caption(
+        f"{metrics['written']:,} orders stored in {metrics['batches']:,} commits "
+        "since the server started; rates and latencies cover the last 10 s."
+    )
+
+
+with st.expander("Order intake"):
+    show_intake()
+
+# Short example of using an object notation
+st.header("2. Example of object notation")
+
+form = st.form("my_form_2")
+selected_val = form.slider("Select a value")
+form.form_submit_button("Submit")
+
+st.write("Selected value:", selected_val)
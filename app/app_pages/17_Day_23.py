@@ -1,5 +1,7 @@
 import streamlit as st
 
+from utils.query_cache import canonical, param, sync
+
 st.title("30 Days of Streamlit")
 st.markdown("### Day 23")
 
@@ -35,3 +37,17 @@ firstname = st.query_params.get("firstname")
 surname = st.query_params.get("surname")
 
 st.write(f"Hello **{firstname} {surname}**, how are you?")
+
+
+# 4. Keeping the URL in sync with widgets
+st.header("4. Keeping the URL in sync with widgets")
+
+# Widgets start from the URL's values and write changes back, so the URL
+# can always be shared to reopen this exact view.
+col1, col2 = st.columns(2)
+firstname = col1.text_input("First name", param("firstname", ""))
+surname = col2.text_input("Surname", param("surname", ""))
+sync(firstname=firstname, surname=surname)
+
+st.write("Link to this view:")
+st.code(f"?{canonical(st.query_params.to_dict())}", language=None)
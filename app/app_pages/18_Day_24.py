@@ -0,0 +1,61 @@
+from time import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import shared_data
+from utils.viewer import dataframe_viewer
+
+st.title("st.cache")
+
+# Using cache
+a0 = time()
+st.subheader("Using st.cache")
+seed = st.number_input("Random seed", 0, 99, 0)
+
+
+# Published once per host in shared memory: every session and server process
+# reads the same read-only columns. Past the size budget, the least recently
+# used frames spill to disk and are memory-mapped back on the next hit.
+def load_data_a(seed):
+    return shared_data.dataset(
+        f"day24-random-{seed}",
+        lambda: pd.DataFrame(
+            np.random.default_rng(seed).random((2000000, 5)),
+            columns=["a", "b", "c", "d", "e"],
+        ),
+    )
+
+
+dataframe_viewer(load_data_a(seed), key="a", version=seed)
+a1 = time()
+st.info(a1 - a0)
+
+stats = shared_data.stats()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Hits", stats["hits"], f"{stats['disk_hits']} from disk", "off")
+col2.metric("Misses", stats["misses"], f"{stats['datasets']} on host", "off")
+col3.metric("Evictions", stats["evictions"], f"{stats['spills']} spilled", "off")
+col4.metric(
+    "Shared memory",
+    f"{stats['bytes'] / 2**20:.0f} MB",
+    f"of {stats['max_bytes'] / 2**20:.0f} MB",
+    "off",
+)
+
+# Not using cache
+b0 = time()
+st.subheader("Not using st.cache")
+
+
+def load_data_b():
+    df = pd.DataFrame(
+        np.random.rand(2000000, 5), columns=["a", "b", "c", "d", "e"]
+    )
+    return df
+
+
+dataframe_viewer(load_data_b(), key="b", version=b0)
+b1 = time()
+st.info(b1 - b0)
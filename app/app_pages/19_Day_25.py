@@ -1,5 +1,7 @@
 import streamlit as st
 
+from utils import sessions
+
 st.title("st.session_state")
 
 
@@ -19,4 +21,6 @@ with col2:
     kirogram = st.number_input("Kilograms:", key="kg", on_change=kg_to_lbs)
 
 st.header("Output")
-st.write("st.session_state object:", st.session_state)
+# Session state is shared by every page of the app, so large values (such as
+# the Day 27 dataset) are summarized rather than sent to the browser.
+st.write("st.session_state object:", sessions.preview(st.session_state))
@@ -0,0 +1,105 @@
+import os
+
+import streamlit as st
+
+from utils import standins
+from utils.http_client import HttpClient
+from utils.prefetch import Prefetcher
+from utils.query_cache import param, sync
+
+
+@st.cache_resource
+def get_client():
+    return HttpClient()
+
+
+@st.cache_resource
+def get_prefetcher():
+    return Prefetcher(get_client(), max_age=30)
+
+
+# The prefetcher is the only cache: a second layer on top would keep serving
+# a suggestion after its background refresh. A link such as `?type=music`
+# opens on the same activity type.
+def suggest(type, api):
+    return get_prefetcher().get(f"{api}/api/activity?type={type}", timeout=15)
+
+
+st.title(":basketball: Bored API app")
+
+st.sidebar.header("Input")
+selected_type = st.sidebar.selectbox(
+    "Select an activity type,",
+    standins.ACTIVITY_TYPES,
+    index=standins.ACTIVITY_TYPES.index(
+        param("type", standins.ACTIVITY_TYPES[0], standins.ACTIVITY_TYPES)
+    ),
+)
+sync(type=selected_type)
+use_standin = st.sidebar.toggle(
+    "Use local stand-in API", help="Serve activities locally, without network."
+)
+
+# BORED_API_URL points the page at another deployment of the API.
+base_url = os.environ.get("BORED_API_URL", "http://www.boredapi.com")
+if use_standin:
+    base_url = standins.serve()
+
+# Warm every activity type at once so switching types never waits on the
+# network; stale responses are served while they refresh in the background.
+client = get_client()
+prefetcher = get_prefetcher()
+prefetcher.warm(
+    f"{base_url}/api/activity?type={activity_type}"
+    for activity_type in standins.ACTIVITY_TYPES
+)
+try:
+    suggested_activity = suggest(type=selected_type, api=base_url)
+except Exception as e:
+    st.error(f"Could not reach the Bored API: {e}")
+    st.stop()
+
+c1, c2 = st.columns(2)
+with c1:
+    with st.expander("About this app"):
+        st.write(
+            "Are you bored? The **Bored API app** provides suggestions on "
+            "activities that you can do when you are bored. This app is "
+            "powered by the Bored API."
+        )
+with c2:
+    with st.expander("JSON data"):
+        st.write(suggested_activity)
+
+st.header("Suggested activity")
+st.info(suggested_activity["activity"])
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric(
+        label="Number of Participants",
+        value=suggested_activity["participants"],
+        delta="",
+    )
+with col2:
+    st.metric(
+        label="Type of Activity",
+        value=suggested_activity["type"].capitalize(),
+        delta="",
+    )
+with col3:
+    st.metric(label="Price", value=suggested_activity["price"], delta="")
+
+with st.sidebar.expander("HTTP client metrics"):
+    cache = prefetcher.metrics()
+    metrics = client.metrics()
+    st.write(
+        f"Cache hit rate: {cache['hit_rate']:.0%} (fresh: {cache['fresh']}, "
+        f"stale: {cache['stale']}, after waiting: {cache['waited']}), "
+        f"errors: {metrics['errors']}"
+    )
+    if metrics["p50_ms"] is not None:
+        st.write(
+            f"Latency p50: {metrics['p50_ms']:.0f} ms, "
+            f"p95: {metrics['p95_ms']:.0f} ms"
+        )
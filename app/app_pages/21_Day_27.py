@@ -1,11 +1,11 @@
 # First, we will need the following imports for our application.
 
-import json
-from pathlib import Path
-
 import streamlit as st
 from streamlit_elements import dashboard, editor, elements, lazy, media, mui, nivo, sync
 
+from utils.bump import payload_size, reduce_bump
+from utils.json_data import parse_editor_text, read_text, validate_bump
+
 # As for Streamlit Elements, we will need all these objects.
 # All available objects and there usage are listed there: https://github.com/okld/streamlit-elements#getting-started
 
@@ -34,7 +34,39 @@ with st.sidebar:
 # code editor change, and it will be read by Nivo Bump chart to draw the data.
 
 if "data" not in st.session_state:
-    st.session_state.data = Path("data.json").read_text()
+    st.session_state.data = read_text("data.json")
+
+# The default data file is read once per process, and the editor text is only
+# parsed when it changes. If an edit isn't valid Bump data, the chart keeps
+# showing the last valid data and the error is reported in the sidebar.
+
+chart_data, error = parse_editor_text(
+    st.session_state.data, "chart_data", validate=validate_bump
+)
+if error is not None:
+    st.sidebar.error(f"Invalid chart data, showing the last valid data: {error}")
+
+# Large rankings are reduced on the server before being sent to the chart:
+# only the best ranked series, and fewer points along x.
+
+with st.sidebar:
+    st.write("---")
+    st.subheader("Chart data reduction")
+    top_n = st.number_input("Series to show (0 = all)", 0, value=20)
+    x_step = st.number_input("Keep every n-th x value", 1, value=1)
+    max_points = st.number_input("Max points per series (0 = no limit)", 0, value=50)
+
+params = (top_n, x_step, max_points)
+reduced = st.session_state.get("chart_reduced")
+if reduced is None or reduced[0] is not chart_data or reduced[1] != params:
+    bump_data = reduce_bump(chart_data or [], *params)
+    sizes = payload_size(chart_data or []), payload_size(bump_data)
+    reduced = st.session_state.chart_reduced = (chart_data, params, bump_data, sizes)
+_, _, bump_data, (size_before, size_after) = reduced
+st.sidebar.caption(
+    f"Chart payload: {size_after / 1024:,.1f} KB "
+    f"(from {size_before / 1024:,.1f} KB)"
+)
 
 # Define a default dashboard layout.
 # Dashboard grid has 12 columns by default.
@@ -170,13 +202,14 @@ with elements("demo"): # type: ignore
                 # Nivo's example is available in the 'code' tab there: https://nivo.rocks/bump/
                 #
                 # Data takes a dictionary as parameter, so we need to convert our JSON data from a string to
-                # a Python dictionary first, with `json.loads()`.
+                # a Python dictionary first; `chart_data` was parsed above, with `json.loads()`, and
+                # reduced to `bump_data`.
                 #
                 # For more information regarding other available Nivo charts:
                 # https://nivo.rocks/
 
                 nivo.Bump(
-                    data=json.loads(st.session_state.data),
+                    data=bump_data,
                     colors={"scheme": "spectral"},
                     lineWidth=3,
                     activeLineWidth=6,
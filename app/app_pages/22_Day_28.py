@@ -0,0 +1,172 @@
+import os
+from time import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import artifacts, instrument, shared_data
+from utils.explain import explain, reduce_instances
+from utils.lazy import lazy_import
+
+# Heavy libraries are imported on first use; xgboost and scikit-learn, for
+# instance, only when the model has to be trained.
+shap = lazy_import("shap")
+xgboost = lazy_import("xgboost")
+model_selection = lazy_import("sklearn.model_selection")
+streamlit_shap = lazy_import("streamlit_shap")
+
+st.set_page_config(layout="wide")
+
+
+# Bump when the training code changes, so old models are not reused.
+TRAINING_VERSION = 1
+PARAMS = {
+    "eta": 0.01,
+    "objective": "binary:logistic",
+    "subsample": 0.5,
+    "eval_metric": "logloss",
+    "n_jobs": -1,
+}
+
+
+# Datasets and the model are stored locally on first use and then reopened
+# by every server process; within a process they are held once and shared by
+# all sessions, without a copy per rerun. The frames themselves sit in shared
+# memory, also read by the SHAP worker processes.
+@st.cache_resource(show_spinner=False)
+def load_data():
+    X_stored, y = artifacts.stored_dataset("adult", shap.datasets.adult)
+    data_key = artifacts.fingerprint(X_stored, y)
+    X = shared_data.dataset(f"adult-{data_key}", lambda: X_stored)
+    return X, y, data_key
+
+
+@st.cache_resource(show_spinner=False)
+def load_display_data():
+    X_stored, y = artifacts.stored_dataset(
+        "adult-display", lambda: shap.datasets.adult(display=True)
+    )
+    key = artifacts.fingerprint(X_stored)
+    return shared_data.dataset(f"adult-display-{key}", lambda: X_stored), y
+
+
+def train_model(X, y):
+    X_train, X_test, y_train, y_test = model_selection.train_test_split(
+        X, y, test_size=0.2, random_state=7
+    )
+    d_train = xgboost.DMatrix(X_train, label=y_train)
+    d_test = xgboost.DMatrix(X_test, label=y_test)
+    params = {**PARAMS, "base_score": np.mean(y_train)}
+    model = xgboost.train(
+        params,
+        d_train,
+        10,
+        evals=[(d_test, "test")],
+        verbose_eval=100,
+        early_stopping_rounds=20,
+    )
+    return model
+
+
+@st.cache_resource(show_spinner="Loading model...")
+def load_model(_X, _y, data_key):
+    key = artifacts.fingerprint(data_key, PARAMS, TRAINING_VERSION)
+    return artifacts.load_or_train(
+        "adult-xgboost",
+        key,
+        lambda: train_model(_X, _y),
+        meta={"data": data_key, "params": PARAMS, "training": TRAINING_VERSION},
+    )
+
+
+st.title("`streamlit-shap` for displaying SHAP plots in a Streamlit app")
+
+with st.expander("About the app"):
+    st.markdown(
+        """[`streamlit-shap`](https://github.com/snehankekre/streamlit-shap) is a Streamlit component that provides a wrapper to display [SHAP](https://github.com/slundberg/shap) plots in [Streamlit](https://streamlit.io/). 
+                    The library is developed by our in-house staff [Snehan Kekre](https://github.com/snehankekre) who also maintains the [Streamlit Documentation](https://docs.streamlit.io/) website.
+                """
+    )
+
+st.header("Input data")
+with instrument.span("load data"):
+    X, y, data_key = load_data()
+    X_display, y_display = load_display_data()
+
+with st.expander("About the data"):
+    st.write("Adult census data is used as the example dataset.")
+with st.expander("X"):
+    st.dataframe(X)
+with st.expander("y"):
+    st.dataframe(y)
+
+st.header("SHAP output")
+
+# train XGBoost model
+with instrument.span("load model"):
+    model = load_model(X, y, data_key)
+
+# compute SHAP values once and share them between all the plots
+st.sidebar.header("SHAP settings")
+mode = st.sidebar.radio("Rows to explain", ["All", "Stratified sample"])
+sample_size = None
+if mode == "Stratified sample":
+    sample_size = st.sidebar.slider(
+        "Sample size",
+        500,
+        len(X),
+        5000,
+        step=500,
+        help="Smaller samples are faster; summary plots converge with 1/sqrt(n).",
+    )
+workers = st.sidebar.slider("Worker processes", 1, os.cpu_count() or 1, 1)
+
+t0 = time()
+progress = st.progress(0.0, "Computing SHAP values...")
+with instrument.span("explain"):
+    shap_values, rows = explain(
+        model,
+        X,
+        y,
+        sample_size=sample_size,
+        workers=workers,
+        progress=lambda done: progress.progress(done, "Computing SHAP values..."),
+    )
+progress.empty()
+st.caption(f"Explained {len(rows):,} of {len(X):,} rows in {time() - t0:.2f} s")
+expected_value = shap_values.base_values[0]
+X_display = X_display.iloc[rows]
+
+with st.expander("Waterfall plot"):
+    streamlit_shap.st_shap(shap.plots.waterfall(shap_values[0]), height=300)
+with st.expander("Beeswarm plot"):
+    streamlit_shap.st_shap(shap.plots.beeswarm(shap_values), height=300)
+
+with st.expander("Force plot"):
+    st.subheader("First data instance")
+    streamlit_shap.st_shap(
+        shap.force_plot(
+            expected_value, shap_values.values[0, :], X_display.iloc[0, :]
+        ),
+        height=200,
+        width=1000,
+    )
+    st.subheader("First thousand data instance")
+    c1, c2 = st.columns(2)
+    n_instances = c1.number_input("Instances", 1, len(rows), min(1000, len(rows)))
+    n_bins = c2.number_input(
+        "Bins",
+        0,
+        1000,
+        0,
+        help="Average similar instances into this many groups (0 = off).",
+    )
+    force_values, force_data = reduce_instances(
+        shap_values.values[:n_instances, :],
+        X_display.iloc[:n_instances, :],
+        bins=n_bins,
+    )
+    force_plot = shap.force_plot(expected_value, force_values, force_data)
+    st.caption(f"Force plot HTML: {len(force_plot.html()) / 1024:,.0f} KB")
+    streamlit_shap.st_shap(force_plot, height=400, width=1000)
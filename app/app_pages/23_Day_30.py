@@ -0,0 +1,112 @@
+import os
+
+import streamlit as st
+
+from utils import standins
+from utils.http_client import HttpClient
+from utils.paths import cache_dir
+from utils.query_cache import param, query_cache, sync
+from utils.thumbnails import DiskLRU, ThumbnailProxy, extract_ids
+
+
+@st.cache_resource
+def get_thumbnail_cache():
+    # One instance for the directory, so its byte budget covers every host.
+    return DiskLRU(cache_dir("thumbnails"), max_bytes=256 * 2**20)
+
+
+@st.cache_resource
+def get_proxy(base_url):
+    return ThumbnailProxy(HttpClient(), get_thumbnail_cache(), base_url=base_url)
+
+
+# A link such as `?v=JwSS70SZdyM&quality=High` opens on a warm result: the
+# best available thumbnail is cached per video, quality and host.
+@query_cache(ttl=3600, max_bytes=64 * 2**20)
+def best_thumbnail(v, quality, host):
+    return get_proxy(host).best(v, quality)
+
+
+st.title("🖼️ yt-img-app")
+st.header("YouTube Thumbnail Image Extractor App")
+
+with st.expander("About this app"):
+    st.write("This app retrieves the thumbnail image from a YouTube video.")
+
+# Image settings
+st.sidebar.header("Settings")
+img_dict = {
+    "Max": "maxresdefault",
+    "High": "hqdefault",
+    "Medium": "mqdefault",
+    "Standard": "sddefault",
+}
+qualities = list(img_dict)
+selected_img_quality = st.sidebar.selectbox(
+    "Select image quality",
+    qualities,
+    index=qualities.index(param("quality", "Max", qualities)),
+)
+img_quality = img_dict[selected_img_quality] # type: ignore
+use_standin = st.sidebar.toggle(
+    "Use local stand-in images", help="Serve thumbnails locally, without network."
+)
+
+# Thumbnails are fetched once by the server and kept on disk; when the chosen
+# quality does not exist for a video, the next best one is used.
+# YT_IMG_URL points the page at another image host.
+base_url = os.environ.get("YT_IMG_URL", "https://img.youtube.com/vi")
+if use_standin:
+    base_url = f"{standins.serve()}/vi"
+proxy = get_proxy(base_url)
+
+single, batch = st.tabs(["Single video", "Batch"])
+
+with single:
+    yt_url = st.text_input(
+        "Paste YouTube URL", f"https://youtu.be/{param('v', 'JwSS70SZdyM')}"
+    )
+
+    # Display YouTube thumbnail image
+    if yt_url != "":
+        ytid = extract_ids([yt_url])[0]
+        quality, data = None, None
+        if isinstance(ytid, str):
+            sync(v=ytid, quality=selected_img_quality)
+            try:
+                quality, data = best_thumbnail(
+                    v=ytid, quality=img_quality, host=base_url
+                )
+            except Exception as e:
+                st.error(f"Could not fetch the thumbnail: {e}")
+                st.stop()
+        if data is not None:
+            st.image(data)
+            st.write("YouTube video thumbnail image URL: ", proxy.url(ytid, quality))
+        else:
+            st.warning("No thumbnail found for this URL.")
+    else:
+        st.write("☝️ Enter URL to continue ...")
+
+with batch:
+    urls = st.text_area("Paste YouTube URLs, one per line", height=200)
+    urls = [url for url in urls.splitlines() if url.strip()]
+    if urls:
+        ytids = extract_ids(urls)
+        found = ytids.dropna().unique()
+        results = dict(zip(found, proxy.best_many(found, img_quality)))
+        st.dataframe(
+            {
+                "URL": urls,
+                "Video ID": ytids,
+                "Quality": [results.get(ytid, (None,))[0] for ytid in ytids],
+            },
+            width="stretch",
+        )
+        images = [(ytid, data) for ytid, (_, data) in results.items() if data]
+        if images:
+            st.image(
+                [data for _, data in images],
+                caption=[ytid for ytid, _ in images],
+                width=240,
+            )
@@ -1,4 +1,20 @@
+from pathlib import Path
+
 import streamlit as st
 
-st.title("Hello world!")
-st.markdown("## :satellite: test page.")
+from utils import instrument, sessions
+
+
+def main():
+    st.title("Hello world!")
+    st.markdown("## :satellite: test page.")
+
+
+# Every page runs through this script, so work needed on every run, such as
+# restoring a session's spilled state or profiling, is done here once for all
+# pages. (A `pages/` directory would make Streamlit run pages without it.)
+pages = sorted((Path(__file__).parent / "app_pages").glob("*.py"))
+page = st.navigation([st.Page(main, default=True)] + [st.Page(p) for p in pages])
+name = page.url_path or "main"
+with sessions.running(name), instrument.run(name):
+    page.run()
@@ -0,0 +1,133 @@
+"""Local store of trained models and prepared datasets.
+
+Models are saved in XGBoost's own format under a key hashed from their
+training data and parameters, so a new server process reloads them instead
+of training again, and changing either trains a new version next to the old
+ones. Datasets are kept in the columnar format and reopened memory-mapped.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import columnar
+from utils.lazy import lazy_import
+from utils.paths import cache_dir
+
+xgboost = lazy_import("xgboost")
+
+MODEL_FILE = "model.ubj"
+META_FILE = "meta.json"
+
+
+def fingerprint(*parts):
+    """Hash DataFrames, arrays and JSON-serializable values together."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            part = pd.util.hash_pandas_object(part, index=True).to_numpy()
+        if isinstance(part, np.ndarray):
+            digest.update(str((part.dtype, part.shape)).encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:32]
+
+
+def _publish(build, path):
+    # Write into a temporary directory next to `path` and rename it into
+    # place, so readers never see a half-written artifact.
+    tmp = tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}-")
+    try:
+        build(tmp)
+        os.replace(tmp, path)
+    except OSError:
+        # Another process published the same artifact first.
+        if not path.exists():
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def load_or_train(name, key, train, meta=None):
+    """The booster stored as `name` under `key`, trained by `train()` once."""
+    path = cache_dir("models", name) / key
+    if not (path / MODEL_FILE).exists():
+        model = train()
+
+        def build(tmp):
+            model.save_model(os.path.join(tmp, MODEL_FILE))
+            with open(os.path.join(tmp, META_FILE), "w") as f:
+                json.dump(
+                    {
+                        "key": key,
+                        "created": time.time(),
+                        "xgboost": xgboost.__version__,
+                        **(meta or {}),
+                    },
+                    f,
+                    default=str,
+                )
+
+        _publish(build, path)
+        return model
+    return xgboost.Booster(model_file=str(path / MODEL_FILE))
+
+
+def models():
+    """Names of the models stored so far."""
+    return sorted(path.name for path in cache_dir("models").iterdir() if path.is_dir())
+
+
+def versions(name):
+    """Metadata of every stored version of model `name`, newest first."""
+    result = []
+    for path in cache_dir("models", name).glob(f"*/{META_FILE}"):
+        result.append(json.loads(path.read_text()))
+    return sorted(result, key=lambda meta: -meta["created"])
+
+
+def _to_frame(value):
+    if isinstance(value, pd.DataFrame):
+        return value, "frame"
+    if isinstance(value, pd.Series):
+        return value.to_frame(), "series"
+    return pd.DataFrame({"values": np.asarray(value)}), "array"
+
+
+def _from_frame(df, kind):
+    if kind == "series":
+        return df.iloc[:, 0]
+    if kind == "array":
+        return df["values"].to_numpy()
+    return df
+
+
+def stored_dataset(name, load):
+    """The frames, series or arrays returned by `load()`, kept on disk.
+
+    The first call stores them in the columnar format; later calls, in any
+    process, reopen them memory-mapped instead of calling `load()`.
+    """
+    path = cache_dir("datasets") / name
+    if not path.exists():
+        parts = [_to_frame(value) for value in load()]
+
+        def build(tmp):
+            for i, (df, _) in enumerate(parts):
+                columnar.write_frame(df, os.path.join(tmp, str(i)))
+            with open(os.path.join(tmp, META_FILE), "w") as f:
+                json.dump([kind for _, kind in parts], f)
+
+        _publish(build, path)
+    kinds = json.loads((path / META_FILE).read_text())
+    return tuple(
+        _from_frame(columnar.read_frame(path / str(i)), kind)
+        for i, kind in enumerate(kinds)
+    )
@@ -0,0 +1,41 @@
+import json
+import math
+
+import numpy as np
+
+
+def payload_size(data):
+    """Size in bytes of `data` once serialized for the browser."""
+    return len(json.dumps(data, separators=(",", ":")))
+
+
+def _mean_rank(serie):
+    ranks = [p["y"] for p in serie["data"] if p["y"] is not None]
+    return np.mean(ranks) if ranks else np.inf
+
+
+def reduce_bump(data, top_n=None, x_step=1, max_points=None):
+    """Shrink Nivo Bump data before it is sent to the browser.
+
+    Keeps the `top_n` series with the best (lowest) mean rank, then keeps
+    every `x_step`-th x value, widening the step so that no series has more
+    than `max_points` points. The first and last x values are always kept,
+    and all series keep the same x values, as Bump charts require.
+    """
+    if top_n and top_n < len(data):
+        ranks = [_mean_rank(serie) for serie in data]
+        keep = sorted(np.argsort(ranks, kind="stable")[:top_n])
+        data = [data[i] for i in keep]
+
+    xs = list(dict.fromkeys(p["x"] for serie in data for p in serie["data"]))
+    step = max(1, x_step)
+    if max_points and len(xs) > max_points:
+        step = max(step, math.ceil((len(xs) - 1) / max(max_points - 1, 1)))
+    if step == 1:
+        return data
+
+    kept = set(xs[::step]) | {xs[-1]}
+    return [
+        {**serie, "data": [p for p in serie["data"] if p["x"] in kept]}
+        for serie in data
+    ]
@@ -0,0 +1,44 @@
+import altair as alt
+import numpy as np
+import streamlit as st
+
+
+def aggregate_points(df, x, y, fields, max_points=5000, method="bin"):
+    """Reduce `df` to at most about `max_points` rows for a scatter plot.
+
+    "bin" averages `fields` over a square grid of x/y cells and adds the
+    number of rows in each cell as `count`; "sample" draws a random sample.
+    """
+    columns = list(dict.fromkeys([x, y, *fields]))
+    if len(df) <= max_points:
+        return df[columns]
+    if method == "sample":
+        return df[columns].sample(max_points, random_state=0)
+
+    cells = max(1, int(np.sqrt(max_points)))
+    keys = []
+    for column in (x, y):
+        values = df[column].to_numpy()
+        lo, hi = np.nanmin(values), np.nanmax(values)
+        scaled = (values - lo) / ((hi - lo) or 1) * cells
+        keys.append(np.clip(scaled.astype(int), 0, cells - 1))
+    grouped = df[columns].groupby(keys[0] * cells + keys[1])
+    return grouped.mean().assign(count=grouped.size()).reset_index(drop=True)
+
+
+@st.cache_data(max_entries=16)
+def scatter_spec(df, x, y, size, color, tooltip, max_points=5000, method="bin"):
+    """Vega-Lite spec of a circle scatter plot, aggregated on the server.
+
+    Cached against the data and the encoding, so reruns skip both the
+    aggregation and the spec building.
+    """
+    data = aggregate_points(df, x, y, [size, color, *tooltip], max_points, method)
+    if "count" in data.columns:
+        tooltip = [*tooltip, "count"]
+    chart = (
+        alt.Chart(data)
+        .mark_circle()
+        .encode(x=x, y=y, size=size, color=color, tooltip=tooltip)
+    )
+    return chart.to_dict()
@@ -0,0 +1,264 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+META = "meta.pkl"
+
+ARROW_TEXT = (
+    pa.types.is_null,
+    pa.types.is_string,
+    pa.types.is_large_string,
+    pa.types.is_binary,
+    pa.types.is_large_binary,
+)
+
+
+def _format(dtype):
+    # Plain NumPy dtypes are written as raw bytes, text and extension dtypes
+    # as Arrow IPC; both are memory-mapped when read. Arbitrary Python
+    # objects, which Arrow can't hold as they are, are pickled.
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        return "raw"
+    return "arrow"
+
+
+def _to_arrow(values):
+    """`values` as an Arrow array, or None if Arrow would change them."""
+    try:
+        array = pa.array(values, from_pandas=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    text = any(is_text(array.type) for is_text in ARROW_TEXT)
+    if values.dtype == object and not text:
+        # Lists, dicts and the like would come back as arrays and structs.
+        return None
+    if pa.types.is_dictionary(array.type):
+        # Categories are restored from the dtype; dictionaries may differ
+        # between chunks, which an IPC file can't hold.
+        array = array.dictionary_decode()
+    return array
+
+
+class ColumnarWriter:
+    """Append DataFrame chunks to a directory with one file per column."""
+
+    def __init__(self, path, index=None):
+        self.path = Path(path)
+        self.index = index
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.columns = None
+        self.rows = 0
+        self._files = []
+
+    def append(self, df):
+        if self.columns is None:
+            self.columns = []
+            for i, (name, dtype) in enumerate(df.dtypes.items()):
+                self.columns.append(
+                    {
+                        "name": name,
+                        "dtype": dtype,
+                        "format": _format(dtype),
+                        "type": None,
+                        "file": f"{i}.col",
+                    }
+                )
+                self._files.append(None)
+                (self.path / f"{i}.col").unlink(missing_ok=True)
+
+        for i, column in enumerate(self.columns):
+            values = df.iloc[:, i]
+            if column["format"] == "raw":
+                array = values.to_numpy()
+                if array.dtype != column["dtype"]:
+                    self._promote(i, np.result_type(column["dtype"], array.dtype))
+            if column["format"] == "raw":
+                array = array.astype(column["dtype"], copy=False)
+                self._open(i).write(np.ascontiguousarray(array).tobytes())
+            elif column["format"] == "arrow":
+                self._append_arrow(i, values)
+            else:
+                pickle.dump(values.to_numpy(), self._open(i))
+        self.rows += len(df)
+
+    def _open(self, i, mode="ab"):
+        if self._files[i] is None:
+            self._files[i] = open(self.path / self.columns[i]["file"], mode)
+        return self._files[i]
+
+    def _append_arrow(self, i, values):
+        column = self.columns[i]
+        array = _to_arrow(values)
+        if array is None:
+            self._rewrite(i, "pickle", self._read(i))
+            pickle.dump(values.to_numpy(), self._open(i))
+            return
+        if column["type"] is not None and array.type != column["type"]:
+            try:
+                array = array.cast(column["type"])
+            except (pa.ArrowException, TypeError, ValueError):
+                # A wider type is needed (e.g. text after a chunk of nulls);
+                # failing that, the column is pickled.
+                old = self._read(i)
+                try:
+                    table = pa.concat_tables(
+                        [pa.table({"values": old}), pa.table({"values": array})],
+                        promote_options="permissive",
+                    )
+                except (pa.ArrowException, TypeError, ValueError):
+                    self._rewrite(i, "pickle", old)
+                    pickle.dump(values.to_numpy(), self._open(i))
+                    return
+                self._rewrite(i, "arrow", table.column(0))
+                return
+        self._write_arrow(i, array)
+
+    def _write_arrow(self, i, array):
+        column = self.columns[i]
+        if self._files[i] is None:
+            column["type"] = array.type
+            sink = pa.OSFile(str(self.path / column["file"]), "wb")
+            schema = pa.schema([("values", array.type)])
+            self._files[i] = (sink, pa.ipc.new_file(sink, schema))
+        self._files[i][1].write_batch(pa.record_batch([array], names=["values"]))
+
+    def _read(self, i):
+        """Everything written to column `i` so far, in memory."""
+        self._close(i)
+        column = self.columns[i]
+        file = self.path / column["file"]
+        if not file.exists():
+            return pa.array(np.empty(0, column["dtype"]), from_pandas=True)
+        if column["format"] == "raw":
+            return pa.array(np.fromfile(file, dtype=column["dtype"]), from_pandas=True)
+        with pa.OSFile(str(file)) as f:
+            return pa.ipc.open_file(f).read_all().column(0)
+
+    def _rewrite(self, i, format, old):
+        column = self.columns[i]
+        self._close(i)
+        column["format"] = format
+        column["type"] = None
+        (self.path / column["file"]).unlink(missing_ok=True)
+        if format == "pickle":
+            column["dtype"] = np.dtype(object)
+            pickle.dump(old.to_numpy(zero_copy_only=False), self._open(i))
+        else:
+            for chunk in old.chunks:
+                self._write_arrow(i, chunk)
+
+    def _promote(self, i, dtype):
+        # A later chunk needs a wider type (e.g. ints that gained NaNs, or
+        # numbers that turned out to be text), so rewrite what has been
+        # written so far.
+        column = self.columns[i]
+        if dtype == column["dtype"]:
+            return
+        self._close(i)
+        file = self.path / column["file"]
+        old = np.fromfile(file, dtype=column["dtype"]) if file.exists() else None
+        old = np.empty(0, column["dtype"]) if old is None else old
+        column["dtype"] = dtype
+        column["format"] = _format(dtype)
+        file.unlink(missing_ok=True)
+        if column["format"] == "raw":
+            old.astype(dtype).tofile(file)
+        else:
+            self._append_arrow(i, pd.Series(old.astype(dtype)))
+
+    def _close(self, i):
+        f = self._files[i]
+        if isinstance(f, tuple):
+            f[1].close()
+            f[0].close()
+        elif f is not None:
+            f.close()
+        self._files[i] = None
+
+    def close(self):
+        for i in range(len(self._files)):
+            self._close(i)
+        with open(self.path / META, "wb") as f:
+            meta = {"columns": self.columns or [], "rows": self.rows}
+            pickle.dump({**meta, "index": self.index}, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_frame(df, path):
+    """Write `df` to `path` in a format `read_frame` can memory-map."""
+    index = None
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        index = list(df.index.names)
+        df = df.reset_index()
+    with ColumnarWriter(path, index=index) as writer:
+        writer.append(df)
+
+
+def exists(path):
+    return (Path(path) / META).exists()
+
+
+def _from_arrow(values, dtype):
+    if dtype == object:
+        return values.to_numpy(zero_copy_only=False)
+    if hasattr(dtype, "__from_arrow__"):
+        # Arrow-backed dtypes such as `str` wrap the mapped buffers as is.
+        return dtype.__from_arrow__(values)
+    return pd.array(values.to_pandas(), dtype=dtype)
+
+
+def read_frame(path):
+    """Open a frame written by `ColumnarWriter` or `write_frame`.
+
+    Numeric columns are read-only memory maps of the files on disk, and text
+    columns Arrow arrays over memory-mapped IPC files, so opening a frame
+    costs no copy however large it is. Only pickled object columns are
+    loaded into memory.
+    """
+    path = Path(path)
+    with open(path / META, "rb") as f:
+        meta = pickle.load(f)
+
+    data = {}
+    for column in meta["columns"]:
+        file = path / column["file"]
+        # Older frames only tell raw columns from pickled ones.
+        format = column.get("format") or ("raw" if column["raw"] else "pickle")
+        if format == "raw":
+            if meta["rows"]:
+                values = np.memmap(
+                    file, dtype=column["dtype"], mode="r", shape=(meta["rows"],)
+                )
+            else:
+                values = np.empty(0, dtype=column["dtype"])
+            values = np.asarray(values)
+        elif format == "arrow" and file.exists():
+            table = pa.ipc.open_file(pa.memory_map(str(file))).read_all()
+            values = _from_arrow(table.column(0), column["dtype"])
+        else:
+            chunks = []
+            if file.exists():
+                with open(file, "rb") as f:
+                    while True:
+                        try:
+                            chunks.append(pickle.load(f))
+                        except EOFError:
+                            break
+            values = np.concatenate(chunks) if chunks else np.empty(0, object)
+            values = pd.array(values, dtype=column["dtype"])
+        # A Series keeps object columns of text from being inferred as `str`.
+        data[column["name"]] = pd.Series(values, dtype=column["dtype"], copy=False)
+
+    df = pd.DataFrame(data, copy=False)
+    if meta["index"]:
+        df = df.set_index(list(df.columns[: len(meta["index"])]))
+        df.index.names = meta["index"]
+    return df
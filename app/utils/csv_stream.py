@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+CHUNK_ROWS = 100_000
+
+
+def read_csv_chunks(file, chunksize=CHUNK_ROWS):
+    """Yield `file` as a sequence of DataFrames of about `chunksize` rows.
+
+    pyarrow's streaming CSV reader is used when it is installed. It infers
+    column types from the first block only, so if a later block does not
+    fit them, the rest of the file is read by pandas instead.
+    """
+    rows = 0
+    if pa_csv is not None:
+        try:
+            reader = pa_csv.open_csv(
+                file, read_options=pa_csv.ReadOptions(block_size=8 * 2**20)
+            )
+            for batch in reader:
+                df = batch.to_pandas()
+                rows += len(df)
+                yield df
+            return
+        except pa.ArrowInvalid:
+            file.seek(0)
+    yield from pd.read_csv(
+        file, chunksize=chunksize, skiprows=range(1, rows + 1) if rows else None
+    )
+
+
+class OnlineStats:
+    """Summary statistics of numeric columns, updated one chunk at a time.
+
+    Count, mean, std, min and max are exact (means and variances are merged
+    with Chan's parallel algorithm); quantiles come from a uniform random
+    sample of at most `sample_size` rows, so memory stays bounded.
+    """
+
+    def __init__(self, sample_size=10_000, seed=0):
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.columns = None
+        self.rows = 0
+
+    def update(self, df):
+        if self.columns is None:
+            self.columns = list(df.select_dtypes("number").columns)
+            k = len(self.columns)
+            self.count = np.zeros(k)
+            self.mean = np.zeros(k)
+            self.m2 = np.zeros(k)
+            self.min = np.full(k, np.nan)
+            self.max = np.full(k, np.nan)
+            self.sample = np.empty((0, k))
+            self.sample_keys = np.empty(0)
+        self.rows += len(df)
+        if not self.columns or df.empty:
+            return
+
+        x = df[self.columns].apply(pd.to_numeric, errors="coerce").to_numpy(float)
+        count = (~np.isnan(x)).sum(axis=0)
+        mean = np.nansum(x, axis=0) / np.maximum(count, 1)
+        m2 = np.nansum((x - mean) ** 2, axis=0)
+
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0)
+            self.m2 = self.m2 + m2 + np.where(
+                total > 0, delta**2 * self.count * count / total, 0
+            )
+        self.count = total
+        self.min = np.fmin(self.min, np.fmin.reduce(x, axis=0))
+        self.max = np.fmax(self.max, np.fmax.reduce(x, axis=0))
+
+        # Keep the rows with the smallest random keys: a uniform sample of
+        # everything seen so far.
+        keys = np.concatenate([self.sample_keys, self.rng.random(len(x))])
+        sample = np.concatenate([self.sample, x])
+        if len(keys) > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[: self.sample_size]
+            keys, sample = keys[keep], sample[keep]
+        self.sample_keys, self.sample = keys, sample
+
+    def describe(self):
+        """Statistics in the layout of `DataFrame.describe()`."""
+        if not self.columns:
+            return pd.DataFrame()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(self.m2 / (self.count - 1))
+            quantiles = np.nanquantile(self.sample, [0.25, 0.5, 0.75], axis=0)
+        return pd.DataFrame(
+            [
+                self.count,
+                np.where(self.count > 0, self.mean, np.nan),
+                std,
+                self.min,
+                *quantiles,
+                self.max,
+            ],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            columns=self.columns,
+        )
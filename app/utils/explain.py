@@ -0,0 +1,159 @@
+import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import shared_data
+from utils.hashing import frame_fingerprint
+from utils.lazy import lazy_import
+
+shap = lazy_import("shap")
+xgboost = lazy_import("xgboost")
+hierarchy = lazy_import("scipy.cluster.hierarchy")
+
+# Above this many instances, hierarchical clustering needs too much memory
+# and instances are ordered by model output instead.
+MAX_CLUSTERED_INSTANCES = 5000
+
+
+def model_fingerprint(model):
+    """Hash an XGBoost booster by its serialized trees."""
+    return hashlib.sha256(model.save_raw()).hexdigest()
+
+
+def stratified_sample(y, size, seed=0):
+    """Sorted positions of about `size` rows with the class balance of `y`."""
+    rng = np.random.default_rng(seed)
+    y = np.asarray(y)
+    rows = []
+    for label in np.unique(y):
+        members = np.flatnonzero(y == label)
+        k = max(1, round(size * len(members) / len(y)))
+        rows.append(rng.choice(members, min(k, len(members)), replace=False))
+    return np.sort(np.concatenate(rows))
+
+
+def _shap_chunk(model_raw, X, rows=None):
+    # Runs in a worker process, so the booster travels as raw bytes, and a
+    # shared dataset as a reference plus the rows to explain.
+    X = shared_data.resolve(X)
+    if rows is not None:
+        X = X.iloc[rows]
+    model = xgboost.Booster()
+    model.load_model(bytearray(model_raw))
+    explainer = shap.TreeExplainer(model)
+    return explainer.shap_values(X), explainer.expected_value
+
+
+def shap_values(model, X, workers=1, chunk_size=2000, progress=None, rows=None):
+    """Compute SHAP values for `X` (or its `rows`), in chunks across processes.
+
+    `progress` is called with the finished fraction as each chunk completes.
+    """
+    if rows is None:
+        rows = np.arange(len(X))
+    chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    model_raw = bytes(model.save_raw())
+    results = [None] * len(chunks)
+    if workers > 1 and len(chunks) > 1:
+        source = shared_data.reference(X)
+        shared = isinstance(source, shared_data.Ref)
+        # Forked workers would inherit the server's threads and locks.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(min(workers, len(chunks)), mp_context=context) as pool:
+            futures = {
+                pool.submit(
+                    _shap_chunk,
+                    model_raw,
+                    *((source, chunk) if shared else (X.iloc[chunk],)),
+                ): i
+                for i, chunk in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress:
+                    progress(done / len(chunks))
+    else:
+        for i, chunk in enumerate(chunks):
+            results[i] = _shap_chunk(model_raw, X.iloc[chunk])
+            if progress:
+                progress((i + 1) / len(chunks))
+
+    values = np.concatenate([result[0] for result in results])
+    expected_value = results[0][1]
+    return shap.Explanation(
+        values,
+        base_values=np.full(len(rows), expected_value),
+        data=X.iloc[rows].to_numpy(),
+        feature_names=list(X.columns),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _explained(model_key, data_key, sample_size):
+    # Only a holder is cached: the SHAP values are computed outside the
+    # cached function, so the caller's progress bar is not recorded for
+    # replay on cache hits.
+    return {"lock": threading.Lock()}
+
+
+def explain(model, X, y=None, sample_size=None, workers=1, progress=None):
+    """Compute SHAP values for `X` once per model, dataset and settings.
+
+    With `sample_size`, only a sample stratified on `y` is explained. Returns
+    the `shap.Explanation` and the positions of the rows it covers; both are
+    shared between reruns and sessions, so treat them as read-only.
+    `progress` is only called when the values have to be computed.
+    """
+    data_key = frame_fingerprint(X)
+    if y is not None:
+        data_key += hashlib.sha256(np.asarray(y).tobytes()).hexdigest()
+    holder = _explained(model_fingerprint(model), data_key, sample_size)
+    with holder["lock"]:
+        if "result" not in holder:
+            if sample_size and sample_size < len(X):
+                rows = stratified_sample(y, sample_size)
+            else:
+                rows = np.arange(len(X))
+            values = shap_values(
+                model, X, workers=workers, progress=progress, rows=rows
+            )
+            holder["result"] = values, rows
+    return holder["result"]
+
+
+def _mode(series):
+    return series.mode().iloc[0]
+
+
+def reduce_instances(values, data, bins=None):
+    """Order similar instances next to each other, optionally binning them.
+
+    `values` are the SHAP values of the rows of `data`. With `bins`, runs of
+    similar instances are averaged into that many groups (numeric features
+    are averaged, others take the group's most common value), which keeps
+    the size of a stacked force plot independent of the instance count.
+    """
+    if len(values) > MAX_CLUSTERED_INSTANCES:
+        order = np.argsort(values.sum(axis=1), kind="stable")
+    elif len(values) > 2:
+        order = hierarchy.leaves_list(hierarchy.linkage(values, "ward"))
+    else:
+        order = np.arange(len(values))
+    values = values[order]
+    data = data.iloc[order]
+    if not bins or bins >= len(values):
+        return values, data
+
+    groups = np.array_split(np.arange(len(values)), bins)
+    labels = np.repeat(np.arange(len(groups)), [len(g) for g in groups])
+    how = {
+        column: "mean" if pd.api.types.is_numeric_dtype(dtype) else _mode
+        for column, dtype in data.dtypes.items()
+    }
+    binned = data.reset_index(drop=True).groupby(labels).agg(how)
+    return np.stack([values[g].mean(axis=0) for g in groups]), binned
@@ -0,0 +1,9 @@
+import hashlib
+
+import pandas as pd
+
+
+def frame_fingerprint(df):
+    """Hash a DataFrame's contents, including its index."""
+    values = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hashlib.sha256(values.tobytes()).hexdigest()
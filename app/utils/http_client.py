@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    """Pooled HTTP session with timeouts, retries and the latest response per URL.
+
+    One client is meant to be shared by every session of the app (see
+    `st.cache_resource`), so connections are reused and the metrics cover all
+    traffic. How long a response stays good is up to the caller, such as
+    `utils.prefetch.Prefetcher`.
+    """
+
+    def __init__(self, timeout=(3.05, 10), retries=3, backoff=0.3, pool_size=10):
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.errors = 0
+        self.latencies = deque(maxlen=1000)
+
+    def cached(self, url):
+        """Return `(value, age in seconds)` for the latest response, or None."""
+        with self._lock:
+            entry = self._cache.get(url)
+        if entry is None:
+            return None
+        fetched_at, value = entry
+        return value, time.monotonic() - fetched_at
+
+    def fetch(self, url):
+        """GET `url` as JSON and keep it as the latest response."""
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            value = response.json()
+        except (requests.RequestException, ValueError):
+            with self._lock:
+                self.errors += 1
+            raise
+        with self._lock:
+            self.latencies.append(time.perf_counter() - start)
+            self._cache[url] = (time.monotonic(), value)
+        return value
+
+    def metrics(self):
+        with self._lock:
+            latencies = np.array(self.latencies) * 1000
+            metrics = {
+                "errors": self.errors,
+                "p50_ms": None,
+                "p95_ms": None,
+            }
+        if len(latencies):
+            metrics["p50_ms"], metrics["p95_ms"] = np.percentile(latencies, [50, 95])
+        return metrics
@@ -0,0 +1,185 @@
+"""Opt-in profiling of page reruns.
+
+Set SANDBOX_PROFILE=1 to enable it. `main.py` runs every page inside
+
+    with instrument.run(page):
+        ...
+
+and pages mark interesting sections with `with instrument.span("name"):`.
+Each run, including runs that raise or call `st.stop()`, is written as JSON
+(total time, spans and a cProfile call tree) for the Diagnostics page. When
+disabled, both calls do next to nothing.
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from utils.paths import cache_dir
+
+ENABLED = os.environ.get("SANDBOX_PROFILE", "") not in ("", "0")
+
+# Runs kept per page, and the share of the run time below which call tree
+# branches are pruned.
+MAX_RUNS = 200
+MIN_SHARE = 0.01
+MAX_DEPTH = 30
+
+_local = threading.local()
+
+
+def profile_dir(page=None):
+    return cache_dir("profiles", page) if page else cache_dir("profiles")
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def call_tree(profiler, total):
+    """Nested dict of where the time went, from a finished cProfile run."""
+    profiler.create_stats()
+    stats = profiler.stats
+    children = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, calls, _, cumulative) in callers.items():
+            children.setdefault(caller, []).append((cumulative, calls, func))
+
+    def node(func, seconds, calls, path, depth):
+        result = {
+            "name": _label(func),
+            "seconds": seconds,
+            "self": stats[func][2],
+            "calls": calls,
+            "children": [],
+        }
+        if depth >= MAX_DEPTH:
+            return result
+        calls_made = sorted(children.get(func, []), key=lambda c: -c[0])
+        for cumulative, child_calls, child in calls_made:
+            if cumulative < total * MIN_SHARE or child in path:
+                continue
+            result["children"].append(
+                node(child, cumulative, child_calls, path | {child}, depth + 1)
+            )
+        return result
+
+    roots = [func for func, value in stats.items() if not value[4]]
+    return {
+        "name": "<rerun>",
+        "seconds": total,
+        "self": 0.0,
+        "calls": 1,
+        "children": [
+            node(func, stats[func][3], stats[func][1], {func}, 1)
+            for func in sorted(roots, key=lambda f: -stats[f][3])
+            if stats[func][3] >= total * MIN_SHARE
+        ],
+    }
+
+
+class Rerun:
+    def __init__(self, page):
+        self.page = page
+        self.started = time.time()
+        self.start_time = time.perf_counter()
+        self.spans = []
+        self.profiler = cProfile.Profile()
+        try:
+            self.profiler.enable()
+        except ValueError:
+            # Another run is being profiled already (Python 3.12+ allows a
+            # single profiler at a time); keep the timings and spans only.
+            self.profiler = None
+
+    def stop(self):
+        seconds = time.perf_counter() - self.start_time
+        if self.profiler is not None:
+            self.profiler.disable()
+        if getattr(_local, "rerun", None) is self:
+            _local.rerun = None
+        record = {
+            "page": self.page,
+            "started": self.started,
+            "seconds": seconds,
+            "spans": self.spans,
+            "tree": call_tree(self.profiler, seconds) if self.profiler else None,
+        }
+        directory = profile_dir(self.page)
+        name = f"{self.started:.6f}-{uuid.uuid4().hex[:8]}.json"
+        (directory / name).write_text(json.dumps(record))
+        for old in sorted(directory.glob("*.json"))[:-MAX_RUNS]:
+            old.unlink(missing_ok=True)
+
+
+class _DisabledRerun:
+    def stop(self):
+        pass
+
+
+_DISABLED = _DisabledRerun()
+
+
+def start(page):
+    """Start profiling a run of `page` (a name or the page script's path)."""
+    if not ENABLED:
+        return _DISABLED
+    previous = getattr(_local, "rerun", None)
+    if previous is not None and previous.profiler is not None:
+        # The previous run on this thread never finished (e.g. st.stop()).
+        previous.profiler.disable()
+    _local.rerun = Rerun(Path(page).stem)
+    return _local.rerun
+
+
+@contextlib.contextmanager
+def run(page):
+    """Profile the page run inside the block, however the block exits."""
+    rerun = start(page)
+    try:
+        yield
+    finally:
+        rerun.stop()
+
+
+@contextlib.contextmanager
+def _span(rerun, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rerun.spans.append(
+            {
+                "name": name,
+                "start": start - rerun.start_time,
+                "seconds": time.perf_counter() - start,
+            }
+        )
+
+
+def span(name):
+    """Context manager timing a named section of the current run."""
+    rerun = getattr(_local, "rerun", None) if ENABLED else None
+    if rerun is None:
+        return contextlib.nullcontext()
+    return _span(rerun, name)
+
+
+def load_runs(page=None):
+    """Recorded runs, for all pages or one, slowest first."""
+    pattern = f"{page}/*.json" if page else "*/*.json"
+    runs = []
+    for path in profile_dir().glob(pattern):
+        try:
+            runs.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            continue
+    return sorted(runs, key=lambda run: -run["seconds"])
@@ -0,0 +1,71 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import streamlit as st
+
+MAX_PARSED = 16
+
+_parsed = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+@st.cache_resource
+def read_text(path):
+    """Contents of a text file, read once per process and shared."""
+    return Path(path).read_text()
+
+
+def parse_json(text):
+    """`json.loads(text)`, reusing results for text that was seen before.
+
+    Results are shared between sessions, so treat them as read-only.
+    """
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    with _parsed_lock:
+        if key in _parsed:
+            _parsed.move_to_end(key)
+            return _parsed[key]
+    data = json.loads(text)
+    with _parsed_lock:
+        _parsed[key] = data
+        while len(_parsed) > MAX_PARSED:
+            _parsed.popitem(last=False)
+    return data
+
+
+def validate_bump(data):
+    """Raise ValueError unless `data` has the shape of Nivo Bump data."""
+    if not isinstance(data, list):
+        raise ValueError("expected a list of series")
+    for i, serie in enumerate(data):
+        if not isinstance(serie, dict) or "id" not in serie:
+            raise ValueError(f"series {i} needs an 'id'")
+        points = serie.get("data")
+        if not isinstance(points, list) or not all(
+            isinstance(point, dict) and "x" in point and "y" in point
+            for point in points
+        ):
+            raise ValueError(f"series {serie['id']!r} needs a list of x/y points")
+
+
+def parse_editor_text(text, key, validate=None):
+    """Parse editor text, falling back to this session's last good result.
+
+    Returns `(data, error)`. Text identical to the previous call is not
+    even hashed again, and a bad edit keeps the last valid data (stored in
+    `st.session_state[key]`) with the error to show next to it.
+    """
+    last = st.session_state.get(key)
+    if last is not None and last[0] is text:
+        return last[1], None
+    try:
+        data = parse_json(text)
+        if validate is not None:
+            validate(data)
+    except ValueError as e:
+        return (last[1] if last is not None else None), e
+    st.session_state[key] = (text, data)
+    return data, None
@@ -0,0 +1,32 @@
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that is only imported on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        if self._lazy_module is None:
+            self.__dict__["_lazy_module"] = importlib.import_module(self.__name__)
+        return self._lazy_module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    """Return module `name`, deferring its import until it is first used.
+
+    Use it for heavy libraries that only some code paths need:
+
+        xgboost = lazy_import("xgboost")
+        model_selection = lazy_import("sklearn.model_selection")
+    """
+    return LazyModule(name)
@@ -0,0 +1,157 @@
+import collections
+import queue
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+FIELDS = ("bean", "roast", "brewing", "serving", "milk", "own_cup")
+
+# Ids are left to SQLite, so several queues (or processes) can share a file.
+INSERT = f"""
+INSERT INTO orders (submitted, {", ".join(FIELDS)})
+VALUES ({", ".join("?" * (len(FIELDS) + 1))})
+"""
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    submitted REAL NOT NULL,
+    {", ".join(f"{name} TEXT" for name in FIELDS)}
+)
+"""
+
+
+class OrderQueue:
+    """Take orders in memory and store them in SQLite from a writer thread.
+
+    `submit()` only puts the order on a queue, so it returns in microseconds
+    whatever the disk is doing. The writer takes everything waiting (up to
+    `batch_size` orders, gathering for at most `max_wait` seconds) and inserts
+    it in a single transaction: one commit, and one WAL fsync, per batch.
+    A batch that fails to store is retried, with backoff, until it succeeds;
+    the error is kept for the readout meanwhile.
+    """
+
+    def __init__(self, path, batch_size=1000, max_wait=0.01, max_pending=100_000):
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue(max_pending)
+        self._lock = threading.Lock()
+        self._written = threading.Condition(self._lock)
+        self.submitted = self.written = self.batches = self.errors = 0
+        self.last_error = None
+        self.started = time.time()
+        # (commit time, orders, latencies) of recent batches, for the readout.
+        self._recent = collections.deque(maxlen=256)
+        threading.Thread(target=self._write_forever, daemon=True).start()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(SCHEMA)
+        return db
+
+    def submit(self, order):
+        """Queue an order (a dict with the keys in FIELDS); return its ticket.
+
+        Tickets number this queue's orders from 1, for `is_written()`.
+        Raises `queue.Full` when the writer is more than `max_pending` orders
+        behind.
+        """
+        row = (time.time(), *(str(order[name]) for name in FIELDS))
+        # Orders are stored in queue order, so the count written so far tells
+        # which tickets are safely on disk.
+        with self._lock:
+            self._queue.put_nowait((row, time.perf_counter()))
+            self.submitted += 1
+            return self.submitted
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                batch.append(
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+        return batch
+
+    def _store(self, db, batch):
+        if db is None:
+            db = self._connect()
+        # Rolled back as a whole on error, so the batch can simply be retried.
+        with db:
+            db.executemany(INSERT, [row for row, _ in batch])
+        return db
+
+    def _write_forever(self):
+        db = None
+        while True:
+            batch = self._next_batch()
+            delay = self.max_wait
+            while True:
+                try:
+                    db = self._store(db, batch)
+                    break
+                except Exception as exc:
+                    with self._lock:
+                        self.errors += 1
+                        self.last_error = f"{type(exc).__name__}: {exc}"
+                    if db is not None:
+                        db.close()
+                        db = None
+                    time.sleep(delay)
+                    delay = min(delay * 2, 5.0)
+            now = time.perf_counter()
+            latencies = [now - queued for _, queued in batch]
+            with self._lock:
+                self.written += len(batch)
+                self.batches += 1
+                self.last_error = None
+                self._recent.append((time.time(), len(batch), latencies))
+                self._written.notify_all()
+
+    def is_written(self, ticket):
+        with self._lock:
+            return ticket <= self.written
+
+    def flush(self, timeout=None):
+        """Wait until every order submitted so far is stored."""
+        with self._lock:
+            target = self.submitted
+            return self._written.wait_for(lambda: self.written >= target, timeout)
+
+    def metrics(self, window=10):
+        """Throughput and submit-to-commit latency over the last `window` s."""
+        now = time.time()
+        with self._lock:
+            since = now - window
+            if len(self._recent) == self._recent.maxlen:
+                since = max(since, self._recent[0][0])
+            recent = [batch for batch in self._recent if batch[0] > since]
+            result = {
+                "submitted": self.submitted,
+                "written": self.written,
+                "pending": self._queue.qsize(),
+                "batches": self.batches,
+                "errors": self.errors,
+                "last_error": self.last_error,
+            }
+        latencies = np.concatenate([b[2] for b in recent]) if recent else np.empty(0)
+        elapsed = now - max(since, self.started)
+        result.update(
+            orders_per_second=len(latencies) / elapsed if elapsed > 0 else 0.0,
+            mean_batch=len(latencies) / len(recent) if recent else 0.0,
+            p50_ms=float(np.percentile(latencies, 50) * 1000) if recent else 0.0,
+            p99_ms=float(np.percentile(latencies, 99) * 1000) if recent else 0.0,
+        )
+        return result
@@ -0,0 +1,15 @@
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "SANDBOX_CACHE_DIR", Path.home() / ".cache" / "sandbox-streamlit"
+    )
+)
+
+
+def cache_dir(*parts):
+    """Return (and create) a directory under the app's local cache."""
+    path = CACHE_DIR.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+
+class Prefetcher:
+    """Serve JSON responses stale-while-revalidate, refreshing in the background.
+
+    Fetches run on an asyncio event loop in a daemon thread (each one in a
+    worker thread through the shared `HttpClient`), so any number of URLs
+    are warmed concurrently without blocking the script thread.
+    """
+
+    def __init__(self, client, max_age=30):
+        self.client = client
+        self.max_age = max_age
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.fresh = self.stale = self.waited = 0
+
+    async def _fetch(self, url):
+        return await asyncio.to_thread(self.client.fetch, url)
+
+    def refresh(self, url):
+        """Start fetching `url` unless already in flight; return its future."""
+        with self._lock:
+            future = self._pending.get(url)
+            if future is None or future.done():
+                future = asyncio.run_coroutine_threadsafe(self._fetch(url), self.loop)
+                self._pending[url] = future
+            return future
+
+    def warm(self, urls):
+        """Fetch every URL that is missing or stale, all at once."""
+        for url in urls:
+            cached = self.client.cached(url)
+            if cached is None or cached[1] > self.max_age:
+                self.refresh(url)
+
+    def get(self, url, timeout=None):
+        """Return the cached response at once, refreshing it if stale.
+
+        Only the very first request for a URL waits on the network.
+        """
+        cached = self.client.cached(url)
+        if cached is None:
+            with self._lock:
+                self.waited += 1
+            return self.refresh(url).result(timeout)
+        value, age = cached
+        with self._lock:
+            if age > self.max_age:
+                self.stale += 1
+            else:
+                self.fresh += 1
+        if age > self.max_age:
+            self.refresh(url)
+        return value
+
+    def metrics(self):
+        with self._lock:
+            lookups = self.fresh + self.stale + self.waited
+            return {
+                "fresh": self.fresh,
+                "stale": self.stale,
+                "waited": self.waited,
+                # Stale responses are served from the cache too.
+                "hit_rate": (self.fresh + self.stale) / lookups if lookups else 0.0,
+            }
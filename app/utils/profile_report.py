@@ -0,0 +1,150 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import uuid
+
+from utils import shared_data
+from utils.hashing import frame_fingerprint
+from utils.lazy import lazy_import
+from utils.paths import cache_dir
+
+# Only needed when a report isn't cached yet, mostly in worker processes.
+ydata_profiling = lazy_import("ydata_profiling")
+
+# Frames with more cells than this are profiled in minimal mode unless a mode
+# is chosen explicitly, skipping correlations, interactions and the other
+# parts that grow quadratically with the number of columns.
+MINIMAL_CELLS = 1_000_000
+
+
+def use_minimal(df):
+    return df.size > MINIMAL_CELLS or len(df.columns) > 100
+
+
+def report_path(df, **config):
+    """Where the report for `df` and `config` is (or will be) stored."""
+    key = json.dumps(
+        {
+            "data": frame_fingerprint(df),
+            "config": config,
+            "version": ydata_profiling.__version__,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return cache_dir("profile_reports") / f"{digest}.html"
+
+
+def _write(path, text):
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
+
+
+def _report(df, minimal, config):
+    return ydata_profiling.ProfileReport(
+        df, minimal=minimal, progress_bar=False, **config
+    )
+
+
+def _run_job(df, minimal, config, path, partial_path, status_path):
+    df = shared_data.resolve(df)
+
+    def status(stage, progress):
+        _write(status_path, json.dumps({"stage": stage, "progress": progress}))
+
+    # A minimal report is quick and covers the overview and the variables,
+    # so it is written first and shown while the full report is computed.
+    if not minimal:
+        status("Profiling variables", 0.05)
+        report = _report(df, True, config)
+        _write(partial_path, report.to_html())
+
+    status("Describing dataset", 0.4)
+    report = _report(df, minimal, config)
+    report.get_description()
+    status("Rendering report", 0.8)
+    _write(path, report.to_html())
+    partial_path.unlink(missing_ok=True)
+    status_path.unlink(missing_ok=True)
+
+
+class ProfileJob:
+    """Generate a profile report in a worker process.
+
+    The page polls `status()` and `partial_html()` on each rerun and can
+    `cancel()` the job at any time. The finished report lands in an on-disk
+    cache keyed by the data and the report config, shared between sessions;
+    progress files belong to the job alone.
+    """
+
+    def __init__(self, df, minimal=None, **config):
+        if minimal is None:
+            minimal = use_minimal(df)
+        self.df = df
+        self.minimal = minimal
+        self.config = config
+        self.path = report_path(df, minimal=minimal, **config)
+        job = uuid.uuid4().hex
+        self.partial_path = self.path.with_suffix(f".{job}.partial.html")
+        self.status_path = self.path.with_suffix(f".{job}.status.json")
+        self.process = None
+        self.cancelled = False
+
+    @property
+    def done(self):
+        return self.path.exists()
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        if self.done or self.running:
+            return
+        self.cancelled = False
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=_run_job,
+            # Shared datasets are attached by the worker rather than pickled.
+            args=(
+                shared_data.reference(self.df),
+                self.minimal,
+                self.config,
+                self.path,
+                self.partial_path,
+                self.status_path,
+            ),
+            daemon=True,
+        )
+        self.process.start()
+
+    def status(self):
+        if self.done:
+            return {"stage": "Done", "progress": 1.0}
+        if self.cancelled:
+            return {"stage": "Cancelled", "progress": 0.0}
+        if self.process is not None and not self.running:
+            return {"stage": "Failed", "progress": 0.0}
+        try:
+            return json.loads(self.status_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {"stage": "Starting", "progress": 0.0}
+
+    def html(self):
+        return self.path.read_text()
+
+    def partial_html(self):
+        try:
+            return self.partial_path.read_text()
+        except FileNotFoundError:
+            return None
+
+    def cancel(self):
+        if self.running:
+            self.process.terminate()
+            self.process.join()
+        self.cancelled = True
+        for path in (self.partial_path, self.status_path):
+            path.unlink(missing_ok=True)
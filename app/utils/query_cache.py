@@ -0,0 +1,144 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+import streamlit as st
+
+from utils.sizes import deep_size
+
+
+def canonical(params):
+    """Stable query string for a mapping of parameters.
+
+    Keys are sorted, values turned into stripped strings (lists keep their
+    order) and empty values dropped, so `?b=2&a=1` and `?a=1&b=2&c=` match.
+    """
+    items = []
+    for key in sorted(params):
+        value = params[key]
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((key, str(v).strip()) for v in values if v is not None)
+    return urlencode([(key, value) for key, value in items if value != ""])
+
+
+def param(name, default=None, choices=None):
+    """The URL's value for `name`, if it is one of `choices`, else `default`."""
+    value = st.query_params.get(name)
+    if value is None or (choices is not None and value not in choices):
+        return default
+    return value
+
+
+def sync(**values):
+    """Write widget values to the URL, so it always links to this view."""
+    for name, value in values.items():
+        value = "" if value is None else str(value)
+        if st.query_params.get(name, "") != value:
+            if value:
+                st.query_params[name] = value
+            else:
+                del st.query_params[name]
+
+
+class QueryCache:
+    """Cache keyed by query strings, bounded by age and by bytes.
+
+    Entries older than `ttl` seconds are recomputed; past `max_bytes` the
+    least recently used ones are dropped.
+    """
+
+    def __init__(self, ttl, max_bytes):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.expired = self.evictions = 0
+        self.bytes = 0
+
+    def get(self, key):
+        """Return `(True, value)` on a hit and `(False, None)` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                self._remove(key)
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key, value):
+        size = deep_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        self.bytes -= self._entries.pop(key)[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Page scripts re-run from scratch, so caches are kept here, keyed by the
+# decorated function's location, to outlive each run.
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def query_cache(ttl=300, max_bytes=64 * 2**20):
+    """Cache a function's results by its keyword arguments as a query string.
+
+    The function is called with keyword arguments only, normally the page's
+    query parameters, so every shared link to a view maps to one entry and
+    opens on a warm result. Results are shared between sessions and must not
+    be mutated.
+    """
+
+    def decorator(fn):
+        name = f"{fn.__code__.co_filename}:{fn.__qualname__}"
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None or (cache.ttl, cache.max_bytes) != (ttl, max_bytes):
+                cache = _caches[name] = QueryCache(ttl, max_bytes)
+
+        @functools.wraps(fn)
+        def wrapper(**params):
+            key = canonical(params)
+            found, value = cache.get(key)
+            if not found:
+                value = fn(**params)
+                cache.put(key, value)
+            return value
+
+        wrapper.stats = cache.stats
+        wrapper.clear = cache.clear
+        return wrapper
+
+    return decorator
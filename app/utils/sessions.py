@@ -0,0 +1,291 @@
+"""Memory accounting for `st.session_state`, with spilling of idle sessions.
+
+`main.py` runs every page inside `sessions.running()`, and pages use
+`sessions.fragment` for fragments that rerun on their own. A background
+thread then measures every tracked session, and once a session has been
+idle for `IDLE_SECONDS` its large plain-data values are written to local
+disk and replaced by placeholders. They are read back, as private copies,
+when the session next runs a page, so server memory follows the active
+sessions rather than all open tabs.
+"""
+
+import contextlib
+import functools
+import os
+import pickle
+import shutil
+import statistics
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils import columnar
+from utils.paths import cache_dir
+from utils.sizes import deep_size
+
+IDLE_SECONDS = float(os.environ.get("SANDBOX_SESSION_IDLE", 300))
+SWEEP_SECONDS = 30
+SPILL_MIN_BYTES = 2**20
+# A session is an outlier when it holds this many times the median footprint.
+OUTLIER_FACTOR = 4
+OUTLIER_MIN_BYTES = 8 * 2**20
+
+SPILLABLE = (pd.DataFrame, np.ndarray, str, bytes, list, tuple, dict)
+
+
+class Spilled:
+    """Stands in for a session state value that was moved to disk."""
+
+    def __init__(self, path, nbytes, frame):
+        self.path = path
+        self.nbytes = nbytes
+        self.frame = frame
+
+    def load(self):
+        # A private, writable copy: pages must not notice the value was away.
+        if self.frame:
+            return columnar.read_frame(self.path).copy()
+        with open(self.path, "rb") as f:
+            return pickle.load(f)
+
+    def discard(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        Path(self.path).unlink(missing_ok=True)
+
+    def __repr__(self):
+        return f"<spilled to disk: {self.nbytes:,} bytes>"
+
+
+class Session:
+    def __init__(self, session_id, state):
+        self.id = session_id
+        # The session's `st.session_state`, as seen by its latest run.
+        self.state = state
+        self.page = None
+        self.last_run = time.time()
+        # Page runs and fragment runs in progress; never spilled meanwhile.
+        self.running = 0
+        self.lock = threading.Lock()
+        self.sizes = {}
+        self.spilled = {}
+        self.dir = cache_dir("sessions", session_id)
+
+    def is_widget(self, key):
+        # Widget values are bound to the frontend and left alone. Streamlit
+        # has no public way to tell them apart: should its internals change,
+        # every key counts as a widget and nothing is spilled.
+        state = getattr(self.state, "_state", None)
+        mapper = getattr(state, "_key_id_mapper", None)
+        return mapper is None or key in mapper
+
+    def measure(self):
+        """Bytes per key; values that did not change are not measured again."""
+        sizes = {}
+        for key, value in self.state.filtered_state.items():
+            if isinstance(value, Spilled):
+                continue
+            # Only the id is kept, so the accounting never holds on to values.
+            known = self.sizes.get(key)
+            if known is not None and known[0] == id(value):
+                sizes[key] = known
+            else:
+                sizes[key] = (id(value), deep_size(value))
+        self.sizes = sizes
+        return {key: size for key, (_, size) in sizes.items()}
+
+    def spill(self):
+        # Called with `self.lock` held and nothing running, so no run can
+        # start and change the state until it is done.
+        state = self.state
+        sizes = self.measure()
+        for key, value in state.filtered_state.items():
+            if (
+                sizes.get(key, 0) < SPILL_MIN_BYTES
+                or self.is_widget(key)
+                or not isinstance(value, SPILLABLE)
+            ):
+                continue
+            frame = isinstance(value, pd.DataFrame)
+            spilled = Spilled(str(self.dir / uuid.uuid4().hex), sizes[key], frame)
+            try:
+                if spilled.frame:
+                    columnar.write_frame(value, spilled.path)
+                else:
+                    with open(spilled.path, "wb") as f:
+                        pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                spilled.discard()
+                continue
+            # Deleting first drops the value from both the new and the old
+            # state of the session, so the memory is actually released.
+            del state[key]
+            state[key] = spilled
+            self.spilled[key] = self.sizes.pop(key)[1]
+            _counters["spills"] += 1
+
+    def restore(self):
+        state = self.state
+        for key, value in state.filtered_state.items():
+            if isinstance(value, Spilled):
+                state[key] = value.load()
+                value.discard()
+                _counters["restores"] += 1
+        self.spilled.clear()
+
+
+_sessions = {}
+_lock = threading.Lock()
+_counters = {"spills": 0, "restores": 0}
+_sweeper = None
+
+
+def track(page=None):
+    """Account for the current session and restore any values it spilled.
+
+    Returns the session, or None outside a script run.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    with _lock:
+        session = _sessions.get(ctx.session_id)
+        if session is None:
+            session = Session(ctx.session_id, ctx.session_state)
+            _sessions[ctx.session_id] = session
+        _start_sweeper()
+    with session.lock:
+        # Each script runner wraps the state in its own thread-safe proxy.
+        session.state = ctx.session_state
+        session.last_run = time.time()
+        session.page = Path(page).stem if page else session.page
+        if session.spilled:
+            session.restore()
+    return session
+
+
+@contextlib.contextmanager
+def running(page=None):
+    """Track the session and keep it from being spilled inside the block."""
+    session = track(page)
+    if session is None:
+        yield
+        return
+    with session.lock:
+        session.running += 1
+    try:
+        yield
+    finally:
+        with session.lock:
+            session.running -= 1
+            session.last_run = time.time()
+
+
+def fragment(func=None, *, run_every=None):
+    """`st.fragment` whose reruns count as activity of the session.
+
+    Fragments rerun without the rest of the page, so without this a session
+    kept busy by a `run_every` fragment would look idle and be spilled.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with running():
+                return func(*args, **kwargs)
+
+        return st.fragment(wrapper, run_every=run_every)
+
+    return decorator if func is None else decorator(func)
+
+
+def _closed(session_id):
+    if not runtime.exists():
+        return False
+    return not runtime.get_instance().is_active_session(session_id)
+
+
+def sweep():
+    """Measure every session, spill idle ones and forget closed ones."""
+    now = time.time()
+    with _lock:
+        sessions = list(_sessions.values())
+    for session in sessions:
+        with session.lock:
+            if _closed(session.id):
+                with _lock:
+                    _sessions.pop(session.id, None)
+                shutil.rmtree(session.dir, ignore_errors=True)
+            elif not session.running and now - session.last_run > IDLE_SECONDS:
+                session.spill()
+            else:
+                session.measure()
+
+
+def _sweep_forever():
+    while True:
+        time.sleep(SWEEP_SECONDS)
+        try:
+            sweep()
+        except Exception:
+            pass
+
+
+def _start_sweeper():
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = threading.Thread(target=_sweep_forever, daemon=True)
+        _sweeper.start()
+
+
+def report():
+    """One row per tracked session, largest first, with outliers flagged."""
+    now = time.time()
+    rows = []
+    with _lock:
+        sessions = list(_sessions.values())
+    for session in sessions:
+        with session.lock:
+            sizes = session.measure()
+            largest = max(sizes, key=sizes.get) if sizes else None
+            rows.append(
+                {
+                    "session": session.id[:8],
+                    "page": session.page,
+                    "idle (s)": round(now - session.last_run),
+                    "memory (MB)": sum(sizes.values()) / 2**20,
+                    "spilled (MB)": sum(session.spilled.values()) / 2**20,
+                    "keys": len(sizes) + len(session.spilled),
+                    "largest key": largest,
+                }
+            )
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+    limit = max(
+        OUTLIER_FACTOR * statistics.median(df["memory (MB)"]),
+        OUTLIER_MIN_BYTES / 2**20,
+    )
+    df["outlier"] = df["memory (MB)"] > limit
+    return df.sort_values("memory (MB)", ascending=False, ignore_index=True)
+
+
+def counters():
+    return dict(_counters, sessions=len(_sessions))
+
+
+def preview(state, max_bytes=1024):
+    """Session state as a dict, with large values replaced by a summary."""
+    result = {}
+    for key, value in state.to_dict().items():
+        size = deep_size(value)
+        if size > max_bytes:
+            value = f"<{type(value).__name__}: {size:,} bytes>"
+        result[key] = value
+    return result
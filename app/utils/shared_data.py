@@ -0,0 +1,467 @@
+"""Datasets published once per host in shared memory.
+
+`dataset(name, load)` calls `load()` in the first process that asks for
+`name` and copies the frame, column by column, into shared memory blocks;
+every session and process on the host then gets a read-only DataFrame whose
+columns are views of those blocks, so adding workers adds no copies. Text
+and other object columns are shared as categoricals (codes in shared memory,
+categories in the manifest).
+
+Manifests are small files in the local cache, written under a file lock.
+Published data lives as long as the process that published it. `MAX_BYTES`
+(at most half of /dev/shm, since writing to a full tmpfs kills the process
+with SIGBUS) bounds both the host and each process (least recently used views are
+unmapped once no longer referenced). Datasets evicted from the host are
+spilled to local disk in the columnar format and reopened memory-mapped on
+their next use, without calling `load()` again; `SPILL_BYTES` bounds the
+disk they take.
+"""
+
+import atexit
+import contextlib
+import hashlib
+import mmap
+import os
+import pickle
+import shutil
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from utils import columnar
+from utils.paths import cache_dir
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+SHM_DIR = "/dev/shm"
+
+
+def _shm_bytes(free=False):
+    """Size (or free space) of the shared memory filesystem, if known."""
+    try:
+        stat = os.statvfs(SHM_DIR)
+    except (AttributeError, OSError):
+        return None
+    return stat.f_frsize * (stat.f_bavail if free else stat.f_blocks)
+
+
+MAX_BYTES = int(os.environ.get("SANDBOX_SHARED_BYTES", 2**30))
+if _shm_bytes() is not None:
+    MAX_BYTES = min(MAX_BYTES, _shm_bytes() // 2)
+SPILL_BYTES = int(os.environ.get("SANDBOX_SPILL_BYTES", 4 * 2**30))
+
+# Views handed out by this process, least recently used first, with their
+# size. Their columns keep the mappings they read alive, so a view dropped
+# from here is unmapped as soon as nothing references it any more.
+_views = OrderedDict()
+# Manifest path -> blocks, for everything this process published.
+_published = {}
+_lock = threading.Lock()
+_counters = {
+    "hits": 0,
+    "misses": 0,
+    "maps": 0,
+    "disk_hits": 0,
+    "evictions": 0,
+    "spills": 0,
+    "unmaps": 0,
+}
+_publish_lock = threading.Lock()
+
+
+def _digest(name):
+    return hashlib.sha256(name.encode()).hexdigest()[:24]
+
+
+def _manifest_path(name):
+    return cache_dir("shared") / f"{_digest(name)}.pkl"
+
+
+def _spill_path(name):
+    return cache_dir("shared", "spilled") / _digest(name)
+
+
+@contextlib.contextmanager
+def _host_lock():
+    with _publish_lock, open(cache_dir("shared") / ".lock", "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _untrack(shm):
+    # Before Python 3.13 every SharedMemory is registered with the process's
+    # resource tracker, which unlinks it when the process exits, from under
+    # every other reader. Lifetimes are managed here instead.
+    if sys.version_info < (3, 13) and os.name == "posix":
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _create_block(block, size):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(block, create=True, size=size, track=False)
+    return _untrack(shared_memory.SharedMemory(block, create=True, size=size))
+
+
+def _map_block(block, size):
+    """A read-only mapping of `block`, unmapped once nothing references it.
+
+    Unlike `SharedMemory.close()`, which unmaps the block even while NumPy
+    arrays still point into it, the mapping is only freed with its arrays.
+    """
+    if os.name != "posix":
+        # Opened through SharedMemory, which fails for a missing block, and
+        # the mapping taken over from it.
+        shm = shared_memory.SharedMemory(block)
+        shm._buf.release()
+        mapping, shm._buf, shm._mmap = shm._mmap, None, None
+        return mapping
+    fd = shared_memory._posixshmem.shm_open(f"/{block}", os.O_RDONLY, mode=0o600)
+    try:
+        return mmap.mmap(fd, size, prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+
+
+def _unlink(blocks):
+    if os.name != "posix":
+        # Windows frees a block when its last handle is closed.
+        return
+    for block in blocks:
+        try:
+            # Not `SharedMemory.unlink()`, which would unregister the block
+            # from the resource tracker again.
+            shared_memory._posixshmem.shm_unlink(f"/{block}")
+        except FileNotFoundError:
+            pass
+
+
+def _remove(path, blocks):
+    """Unlink a dataset's blocks and its manifest, if it still names them."""
+    _unlink(blocks)
+    with _lock:
+        _published.pop(path, None)
+    manifest = _read_manifest(path)
+    if manifest is not None and _blocks(manifest) == list(blocks):
+        path.unlink(missing_ok=True)
+
+
+def _unlink_published():
+    for path, blocks in list(_published.items()):
+        _remove(path, blocks)
+
+
+atexit.register(_unlink_published)
+
+
+def _read_manifest(path):
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _blocks(manifest):
+    return [column["block"] for column in manifest["columns"]]
+
+
+def _live(manifest):
+    try:
+        _map_block(_blocks(manifest)[0], 1).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _manifests():
+    """`(mtime, path, manifest)` of every dataset that still exists.
+
+    Manifests whose blocks are gone (their publisher crashed) are removed.
+    """
+    result = []
+    for path in cache_dir("shared").glob("*.pkl"):
+        manifest = _read_manifest(path)
+        if manifest is None:
+            continue
+        if not _live(manifest):
+            path.unlink(missing_ok=True)
+            continue
+        result.append((path.stat().st_mtime, path, manifest))
+    return result
+
+
+def _columns(df):
+    """`(name, values, categories)` with values as plain NumPy arrays."""
+    for name, column in df.items():
+        dtype = column.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            yield name, column.to_numpy(), None
+        else:
+            categorical = column.astype("category")
+            yield name, categorical.cat.codes.to_numpy(), categorical.dtype
+
+
+def _write_spilled(name, df):
+    path = _spill_path(name)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        columnar.write_frame(df, tmp)
+        os.replace(tmp, path)
+    except OSError:
+        # Another process spilled it first.
+        return False
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return True
+
+
+def _spill(manifest):
+    """Write a published dataset to disk, unless it is there already."""
+    path = _spill_path(manifest["name"])
+    if columnar.exists(path):
+        return
+    try:
+        df = _view(manifest)
+    except FileNotFoundError:
+        return
+    if _write_spilled(manifest["name"], df):
+        with _lock:
+            _counters["spills"] += 1
+    _trim_spilled()
+
+
+def _spilled():
+    """`(mtime, path, bytes)` of every dataset spilled to disk."""
+    result = []
+    for path in cache_dir("shared", "spilled").iterdir():
+        if path.suffix != ".tmp" and columnar.exists(path):
+            size = sum(f.stat().st_size for f in path.iterdir())
+            result.append((path.stat().st_mtime, path, size))
+    return result
+
+
+def _trim_spilled():
+    spilled = _spilled()
+    total = sum(size for _, _, size in spilled)
+    for _, path, size in sorted(spilled):
+        if total <= SPILL_BYTES:
+            break
+        # Processes that mapped its files keep reading them.
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+def _evict(needed):
+    manifests = _manifests()
+    total = sum(manifest["nbytes"] for _, _, manifest in manifests)
+    for _, path, manifest in sorted(manifests, key=lambda m: m[0]):
+        if total + needed <= MAX_BYTES:
+            break
+        _spill(manifest)
+        _remove(path, _blocks(manifest))
+        total -= manifest["nbytes"]
+        with _lock:
+            _counters["evictions"] += 1
+
+
+def _publish(name, df):
+    original = df
+    index = None
+    if not df.index.equals(pd.RangeIndex(len(df))):
+        index = list(df.index.names)
+        df = df.reset_index()
+    columns = list(_columns(df))
+    nbytes = sum(values.nbytes for _, values, _ in columns)
+    _evict(nbytes)
+    free = _shm_bytes(free=True)
+    if free is not None and nbytes > free // 2:
+        # Too little shared memory left (other users, or a small container
+        # /dev/shm): keep the dataset on disk only.
+        _write_spilled(name, original)
+        _trim_spilled()
+        return None
+
+    prefix = f"sbx{uuid.uuid4().hex[:12]}"
+    manifest = {"name": name, "rows": len(df), "index": index, "nbytes": nbytes}
+    manifest["columns"] = []
+    for i, (column, values, categories) in enumerate(columns):
+        shm = _create_block(f"{prefix}_{i}", max(values.nbytes, 1))
+        np.ndarray(values.shape, values.dtype, buffer=shm.buf)[:] = values
+        shm.close()
+        manifest["columns"].append(
+            {
+                "name": column,
+                "block": shm.name,
+                "dtype": values.dtype,
+                "categories": categories,
+            }
+        )
+
+    path = _manifest_path(name)
+    with _lock:
+        _published[path] = _blocks(manifest)
+    tmp = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(manifest, f)
+    os.replace(tmp, path)
+    return manifest
+
+
+def _view(manifest):
+    data = {}
+    for column in manifest["columns"]:
+        dtype, rows = np.dtype(column["dtype"]), manifest["rows"]
+        block = _map_block(column["block"], max(rows * dtype.itemsize, 1))
+        values = np.frombuffer(block, dtype, count=rows)
+        values.flags.writeable = False
+        if column["categories"] is not None:
+            values = pd.Categorical.from_codes(
+                values, dtype=column["categories"], validate=False
+            )
+        data[column["name"]] = values
+
+    df = pd.DataFrame(data, copy=False)
+    if manifest["index"]:
+        df = df.set_index(list(df.columns[: len(manifest["index"])]))
+        df.index.names = manifest["index"]
+    return df
+
+
+def _trim():
+    with _lock:
+        total = sum(nbytes for _, nbytes in _views.values())
+        while total > MAX_BYTES and len(_views) > 1:
+            _, (_, nbytes) = _views.popitem(last=False)
+            total -= nbytes
+            _counters["unmaps"] += 1
+
+
+def attach(name):
+    """The published dataset `name`; raise KeyError if it is not available."""
+    with _lock:
+        view = _views.get(name)
+        if view is not None:
+            _views.move_to_end(name)
+            _counters["hits"] += 1
+    if view is not None:
+        # Keeps datasets in use by this process the most recent on the host.
+        _touch(name)
+        return view[0]
+    path = _manifest_path(name)
+    manifest = _read_manifest(path)
+    if manifest is None:
+        return _attach_spilled(name)
+    try:
+        df = _view(manifest)
+    except FileNotFoundError:
+        # Its publisher has exited since.
+        path.unlink(missing_ok=True)
+        return _attach_spilled(name)
+    os.utime(path)
+    with _lock:
+        _counters["maps"] += 1
+        # Another thread may have attached it in the meantime.
+        view = _views.setdefault(name, (df, manifest["nbytes"]))
+    _trim()
+    return view[0]
+
+
+def _touch(name):
+    for path in (_manifest_path(name), _spill_path(name)):
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            pass
+    return False
+
+
+def _attach_spilled(name):
+    path = _spill_path(name)
+    if not columnar.exists(path):
+        raise KeyError(name)
+    df = columnar.read_frame(path)
+    os.utime(path)
+    nbytes = int(df.memory_usage(index=False).sum())
+    with _lock:
+        _counters["disk_hits"] += 1
+        view = _views.setdefault(name, (df, nbytes))
+    _trim()
+    return view[0]
+
+
+def dataset(name, load):
+    """The dataset `name` as a read-only shared view, published by `load()`.
+
+    `name` identifies the contents: include whatever the data depends on.
+    """
+    try:
+        return attach(name)
+    except KeyError:
+        pass
+    with _host_lock():
+        try:
+            return attach(name)
+        except KeyError:
+            with _lock:
+                _counters["misses"] += 1
+            _publish(name, load())
+    return attach(name)
+
+
+class Ref:
+    """Picklable stand-in for a shared dataset, resolved by the receiver."""
+
+    def __init__(self, name):
+        self.name = name
+
+
+def reference(df):
+    """A `Ref` to send instead of `df` to another process, if it is shared.
+
+    The dataset is marked as just used, so it stays on the host (or at least
+    on disk) while the receiver attaches it; if it is gone already, `df`
+    itself is returned, to be sent by value.
+    """
+    with _lock:
+        names = [name for name, (view, _) in _views.items() if view is df]
+    for name in names:
+        if _touch(name):
+            return Ref(name)
+    return df
+
+
+def resolve(value):
+    """The dataset behind a `Ref`; anything else is returned as is."""
+    return attach(value.name) if isinstance(value, Ref) else value
+
+
+def stats():
+    """Datasets on the host and on disk, and this process's views and counters."""
+    manifests = _manifests()
+    spilled = _spilled()
+    with _lock:
+        return {
+            "datasets": len(manifests),
+            "bytes": sum(manifest["nbytes"] for _, _, manifest in manifests),
+            "max_bytes": MAX_BYTES,
+            "spilled": len(spilled),
+            "spilled_bytes": sum(size for _, _, size in spilled),
+            "attached": len(_views),
+            "attached_bytes": sum(nbytes for _, nbytes in _views.values()),
+            **_counters,
+        }
@@ -0,0 +1,28 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+def deep_size(value, _seen=None):
+    """Approximate bytes held by `value`, following containers and objects."""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            deep_size(k, _seen) + deep_size(v, _seen) for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_size(item, _seen) for item in value)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += deep_size(vars(value), _seen)
+    return size
@@ -0,0 +1,229 @@
+"""Local stand-ins for the web services some pages call.
+
+They serve the Bored API (Day 26), YouTube thumbnails (Day 30) and a
+synthetic penguins dataset (Day 14), so those pages can run, and be
+benchmarked, without network access. `adult()` stands in for the census
+dataset Day 28 downloads through SHAP:
+
+    python -m utils.standins --port 8765
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import struct
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+ACTIVITY_TYPES = [
+    "education",
+    "recreational",
+    "social",
+    "diy",
+    "charity",
+    "cooking",
+    "relaxation",
+    "music",
+    "busywork",
+]
+
+ACTIVITIES = {
+    "education": ["Learn a new programming language", "Watch a documentary"],
+    "recreational": ["Go for a hike", "Have a picnic in the park"],
+    "social": ["Call a friend you haven't talked to in a while", "Host a game night"],
+    "diy": ["Build a bird house", "Repaint a piece of furniture"],
+    "charity": ["Volunteer at a food bank", "Donate clothes you no longer wear"],
+    "cooking": ["Bake bread from scratch", "Cook a dish from another country"],
+    "relaxation": ["Take a long bath", "Meditate for fifteen minutes"],
+    "music": ["Learn a song on an instrument", "Make a playlist for a friend"],
+    "busywork": ["Clean out your inbox", "Organize your closet"],
+}
+
+
+def random_activity(activity_type):
+    activity_type = activity_type if activity_type in ACTIVITIES else "busywork"
+    return {
+        "activity": random.choice(ACTIVITIES[activity_type]),
+        "type": activity_type,
+        "participants": random.randint(1, 4),
+        "price": round(random.random(), 1),
+        "link": "",
+        "key": str(random.randint(1_000_000, 9_999_999)),
+        "accessibility": round(random.random(), 1),
+    }
+
+
+THUMBNAIL_SIZES = {
+    "maxresdefault": (1280, 720),
+    "sddefault": (640, 480),
+    "hqdefault": (480, 360),
+    "mqdefault": (320, 180),
+}
+
+
+def png(width, height, rgb):
+    """A solid-colour PNG image."""
+
+    def chunk(kind, data):
+        body = kind + data
+        crc = struct.pack(">I", zlib.crc32(body))
+        return struct.pack(">I", len(data)) + body + crc
+
+    row = b"\x00" + bytes(rgb) * width
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+def thumbnail(ytid, quality):
+    """A fake thumbnail, or None for qualities this video "lacks".
+
+    Like on YouTube, not every video has a maxresdefault thumbnail.
+    """
+    digest = hashlib.sha256(ytid.encode()).digest()
+    if quality not in THUMBNAIL_SIZES:
+        return None
+    if quality == "maxresdefault" and digest[0] % 2:
+        return None
+    return png(*THUMBNAIL_SIZES[quality], digest[1:4])
+
+
+def penguins_csv(rows=333, seed=0):
+    """CSV shaped like the penguins_cleaned dataset, with made-up values."""
+    rng = random.Random(seed)
+    lines = [
+        "species,island,bill_length_mm,bill_depth_mm,flipper_length_mm,"
+        "body_mass_g,sex"
+    ]
+    for _ in range(rows):
+        species, island = rng.choice(
+            [("Adelie", "Torgersen"), ("Chinstrap", "Dream"), ("Gentoo", "Biscoe")]
+        )
+        lines.append(
+            f"{species},{island},{rng.gauss(44, 5):.1f},{rng.gauss(17, 2):.1f},"
+            f"{rng.gauss(200, 14):.0f},{rng.gauss(4200, 800):.0f},"
+            f"{rng.choice(['male', 'female'])}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+ADULT_CATEGORIES = {
+    "Workclass": ["Private", "Self-emp-not-inc", "Local-gov", "State-gov"],
+    "Marital Status": ["Married-civ-spouse", "Never-married", "Divorced"],
+    "Occupation": ["Prof-specialty", "Craft-repair", "Sales", "Adm-clerical"],
+    "Relationship": ["Husband", "Not-in-family", "Own-child", "Wife"],
+    "Race": ["White", "Black", "Asian-Pac-Islander", "Other"],
+    "Sex": ["Male", "Female"],
+    "Country": ["United-States", "Mexico", "Philippines", "Germany"],
+}
+
+
+def adult(display=False, rows=5000, seed=0):
+    """`(X, y)` shaped like `shap.datasets.adult`, with made-up values."""
+    rng = np.random.default_rng(seed)
+
+    def number(low, high):
+        return rng.integers(low, high, rows).astype(np.float32)
+
+    def category(name):
+        categories = ADULT_CATEGORIES[name]
+        codes = rng.integers(0, len(categories), rows).astype(np.int8)
+        return pd.Categorical.from_codes(codes, categories) if display else codes
+
+    X = pd.DataFrame(
+        {
+            "Age": number(17, 90),
+            "Workclass": category("Workclass"),
+            "Education-Num": number(1, 17),
+            "Marital Status": category("Marital Status"),
+            "Occupation": category("Occupation"),
+            "Relationship": category("Relationship"),
+            "Race": category("Race"),
+            "Sex": category("Sex"),
+            "Capital Gain": number(0, 20000),
+            "Capital Loss": number(0, 2000),
+            "Hours per week": number(1, 99),
+            "Country": category("Country"),
+        }
+    )
+    score = X["Education-Num"] / 16 + X["Hours per week"] / 99 + rng.random(rows)
+    return X, (score > 1.3).to_numpy()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def send_json(self, value, status=200):
+        body = json.dumps(value).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_image(self, data):
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_text(self, text, content_type):
+        body = text.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = url.path.strip("/").split("/")
+        if url.path == "/api/activity":
+            self.send_json(random_activity(query.get("type", [""])[0]))
+        elif url.path == "/penguins_cleaned.csv":
+            self.send_text(penguins_csv(), "text/csv")
+        elif len(parts) == 3 and parts[0] == "vi" and parts[2].endswith(".jpg"):
+            data = thumbnail(parts[1], parts[2].removesuffix(".jpg"))
+            if data is None:
+                self.send_json({"error": "not found"}, status=404)
+            else:
+                self.send_image(data)
+        else:
+            self.send_json({"error": "not found"}, status=404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port=0):
+    """Start the stand-in server once per process and return its base URL."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer(("127.0.0.1", port), StandInHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+    host, port = _server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StandInHandler)
+    print(f"Serving stand-ins on http://127.0.0.1:{args.port}")
+    server.serve_forever()
@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class RingBuffer:
+    """The last `capacity` rows of a stream, in arrays allocated once.
+
+    Each row also gets a sequence number, which serves as the chart index.
+    """
+
+    def __init__(self, capacity, columns, dtype=float):
+        self.capacity = capacity
+        self.columns = list(columns)
+        self._values = np.empty((capacity, len(self.columns)), dtype=dtype)
+        self._seq = np.empty(capacity, dtype=np.int64)
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def extend(self, rows):
+        """Append `rows`; returns the sequence numbers of those kept."""
+        rows = np.asarray(rows)
+        skipped = max(0, len(rows) - self.capacity)
+        self.total += skipped
+        rows = rows[skipped:]
+        seq = np.arange(self.total, self.total + len(rows))
+        start = self.total % self.capacity
+        first = min(len(rows), self.capacity - start)
+        self._values[start : start + first] = rows[:first]
+        self._seq[start : start + first] = seq[:first]
+        self._values[: len(rows) - first] = rows[first:]
+        self._seq[: len(rows) - first] = seq[first:]
+        self.total += len(rows)
+        return seq
+
+    def view(self):
+        """`(seq, values)` of the buffered rows, oldest first."""
+        if self.total <= self.capacity:
+            return self._seq[: self.total], self._values[: self.total]
+        start = self.total % self.capacity
+        order = np.r_[start : self.capacity, 0:start]
+        return self._seq[order], self._values[order]
+
+
+def minmax_decimate(seq, values, bins):
+    """Keep each column's min and max per bin, 2 * `bins` rows at most.
+
+    Spikes survive decimation, unlike with plain striding or averaging. The
+    two extremes of a bin keep their order of occurrence, at the bin's first
+    and last sample, so a falling line stays a falling line.
+    """
+    if len(values) <= 2 * bins:
+        return seq, values
+    per_bin = len(values) // bins
+    n = per_bin * bins
+    # The remainder that doesn't fill a whole bin is kept as is.
+    blocks = values[-n:].reshape(bins, per_bin, -1)
+    blocks_seq = seq[-n:].reshape(bins, per_bin)
+    lo, hi = blocks.argmin(axis=1), blocks.argmax(axis=1)
+    positions = np.stack([np.minimum(lo, hi), np.maximum(lo, hi)], axis=1)
+    extremes = np.take_along_axis(blocks, positions, axis=1)
+    extremes_seq = np.stack([blocks_seq[:, 0], blocks_seq[:, -1]], axis=1)
+    rest = len(values) - n
+    return (
+        np.concatenate([seq[:rest], extremes_seq.reshape(-1)]),
+        np.concatenate([values[:rest], extremes.reshape(-1, values.shape[1])]),
+    )
+
+
+def to_frame(seq, values, columns):
+    return pd.DataFrame(values, index=pd.Index(seq, name="sample"), columns=columns)
+
+
+class SimulatedTelemetry:
+    """Random-walk readings arriving at `rate` points per second."""
+
+    def __init__(self, columns, rate, seed=None):
+        self.columns = list(columns)
+        self.rate = rate
+        self.rng = np.random.default_rng(seed)
+        self.last = np.zeros(len(self.columns))
+        self.read_at = time.monotonic()
+
+    def read(self, max_rows=None):
+        """Readings that arrived since the previous call, at most `max_rows`.
+
+        Older readings beyond `max_rows` (say, after the stream was paused)
+        are skipped rather than generated.
+        """
+        now = time.monotonic()
+        n = int((now - self.read_at) * self.rate)
+        if max_rows is not None and n > max_rows:
+            self.read_at += (n - max_rows) / self.rate
+            n = max_rows
+        if n == 0:
+            return np.empty((0, len(self.columns)))
+        self.read_at += n / self.rate
+        steps = self.rng.normal(0, 0.1, (n, len(self.columns)))
+        rows = self.last + np.cumsum(steps, axis=0)
+        self.last = rows[-1]
+        return rows
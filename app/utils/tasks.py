@@ -0,0 +1,134 @@
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import streamlit as st
+
+# Finished tasks stay available this long, so a page that was navigated away
+# from can still collect the result.
+KEEP_SECONDS = 3600
+
+
+class Progress:
+    """Callable handed to tasks to report `(fraction, message)`.
+
+    It writes to a plain dict for thread tasks and to a manager dict for
+    process tasks, so it can be pickled into a worker process.
+    """
+
+    def __init__(self, state):
+        self.state = state
+
+    def __call__(self, fraction, message=""):
+        self.state.update(fraction=fraction, message=message)
+
+
+class TaskHandle:
+    def __init__(self, task_id, future, state):
+        self.id = task_id
+        self.future = future
+        self._state = state
+        self.finished = None
+
+    def progress(self):
+        """`(fraction, message)` last reported by the task."""
+        return self._state.get("fraction", 0.0), self._state.get("message", "")
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def cancel(self):
+        """Cancel the task if it has not started yet."""
+        return self.future.cancel()
+
+
+class TaskRunner:
+    """Run functions on shared thread and process pools, off the script thread.
+
+    Tasks are called with a `progress` keyword argument; pages keep the
+    returned handle (or its id) and render its progress on each rerun.
+    Process tasks must be importable functions, not ones defined in a page.
+    """
+
+    def __init__(self, threads=4, processes=2):
+        self._threads = ThreadPoolExecutor(threads, thread_name_prefix="task")
+        self._processes = None
+        self._process_count = processes
+        self._manager = None
+        self._tasks = {}
+        self._lock = threading.Lock()
+
+    def _process_pool(self):
+        # Started on first use; spawned workers don't inherit server threads.
+        if self._processes is None:
+            context = multiprocessing.get_context("spawn")
+            self._manager = context.Manager()
+            self._processes = ProcessPoolExecutor(
+                self._process_count, mp_context=context
+            )
+        return self._processes
+
+    def submit(self, fn, *args, kind="thread", **kwargs):
+        """Run `fn(*args, progress=..., **kwargs)` in a `kind` pool."""
+        with self._lock:
+            if kind == "process":
+                pool = self._process_pool()
+                state = self._manager.dict()
+            else:
+                pool = self._threads
+                state = {}
+        future = pool.submit(fn, *args, progress=Progress(state), **kwargs)
+        handle = TaskHandle(uuid.uuid4().hex, future, state)
+        with self._lock:
+            self._expire()
+            self._tasks[handle.id] = handle
+        future.add_done_callback(lambda _: setattr(handle, "finished", time.time()))
+        return handle
+
+    def _expire(self):
+        now = time.time()
+        for task_id, handle in list(self._tasks.items()):
+            if handle.finished is not None and now - handle.finished > KEEP_SECONDS:
+                del self._tasks[task_id]
+
+    def get(self, task_id):
+        with self._lock:
+            self._expire()
+            return self._tasks.get(task_id)
+
+
+@st.cache_resource
+def get_runner():
+    return TaskRunner()
+
+
+def session_task(key, fn, *args, kind="thread", **kwargs):
+    """The task stored under `key` in this session, submitting it if needed.
+
+    Once the task finishes, its result is kept in the session as well, under
+    `f"{key}_result"`, or the exception it raised under `f"{key}_error"`.
+    """
+    runner = get_runner()
+    result_key, error_key = f"{key}_result", f"{key}_error"
+    finished = result_key in st.session_state or error_key in st.session_state
+    handle = runner.get(st.session_state.get(key, ""))
+    if handle is None and not finished:
+        handle = runner.submit(fn, *args, kind=kind, **kwargs)
+        st.session_state[key] = handle.id
+    if handle is not None and handle.done() and not finished:
+        try:
+            st.session_state[result_key] = handle.result()
+        except Exception as e:
+            st.session_state[error_key] = e
+    return handle
+
+
+def reset_session_task(key):
+    st.session_state.pop(key, None)
+    st.session_state.pop(f"{key}_result", None)
+    st.session_state.pop(f"{key}_error", None)
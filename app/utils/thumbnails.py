@@ -0,0 +1,117 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# Matches youtu.be links, the usual youtube.com URL shapes and bare IDs.
+YTID_PATTERN = (
+    r"(?:youtu\.be/|youtube\.com/(?:watch\?(?:.*&)?v=|embed/|shorts/|live/|v/)|^)"
+    r"([A-Za-z0-9_-]{11})(?=$|[?&#/])"
+)
+
+# Thumbnail names from best to worst; not every video has all of them.
+QUALITIES = ["maxresdefault", "sddefault", "hqdefault", "mqdefault"]
+
+
+def extract_ids(urls):
+    """Video IDs of `urls` in one vectorized pass (NaN where none is found)."""
+    return pd.Series(urls, dtype="object").str.strip().str.extract(YTID_PATTERN)[0]
+
+
+class DiskLRU:
+    """Byte strings stored as files, evicting the least recently used ones."""
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        files = sorted(path.iterdir(), key=lambda f: f.stat().st_mtime)
+        self._sizes = OrderedDict((f.name, f.stat().st_size) for f in files)
+        self.bytes = sum(self._sizes.values())
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+        file = self.path / key
+        try:
+            os.utime(file)
+            return file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, data):
+        tmp = self.path / f".{key}.{threading.get_ident()}.tmp"
+        tmp.write_bytes(data)
+        tmp.replace(self.path / key)
+        with self._lock:
+            self.bytes += len(data) - self._sizes.pop(key, 0)
+            self._sizes[key] = len(data)
+            while self.bytes > self.max_bytes and len(self._sizes) > 1:
+                old, size = self._sizes.popitem(last=False)
+                self.bytes -= size
+                (self.path / old).unlink(missing_ok=True)
+
+
+class ThumbnailProxy:
+    """Fetch YouTube thumbnails on the server and keep them on local disk.
+
+    Cache keys include the image host, so proxies for different hosts can
+    share one `DiskLRU`.
+    """
+
+    def __init__(
+        self, client, cache, base_url="https://img.youtube.com/vi", workers=16
+    ):
+        self.client = client
+        self.cache = cache
+        self.base_url = base_url
+        self.workers = workers
+        self._host = hashlib.sha256(base_url.encode()).hexdigest()[:12]
+        self._missing = set()
+
+    def url(self, ytid, quality):
+        return f"{self.base_url}/{ytid}/{quality}.jpg"
+
+    def fetch(self, ytid, quality):
+        """Image bytes of one thumbnail, or None if the video lacks it."""
+        key = f"{self._host}_{ytid}_{quality}.jpg"
+        data = self.cache.get(key)
+        if data is not None or key in self._missing:
+            return data
+        response = self.client.session.get(
+            self.url(ytid, quality), timeout=self.client.timeout
+        )
+        if response.status_code == 404:
+            self._missing.add(key)
+            return None
+        response.raise_for_status()
+        self.cache.put(key, response.content)
+        return response.content
+
+    def best(self, ytid, quality=QUALITIES[0]):
+        """`(quality, bytes)` of the best thumbnail no better than `quality`."""
+        for candidate in QUALITIES[QUALITIES.index(quality) :]:
+            data = self.fetch(ytid, candidate)
+            if data is not None:
+                return candidate, data
+        return None, None
+
+    def best_many(self, ytids, quality=QUALITIES[0]):
+        """`best` for many videos, resolved concurrently.
+
+        Videos whose thumbnails cannot be fetched get `(None, None)`.
+        """
+
+        def best(ytid):
+            try:
+                return self.best(ytid, quality)
+            except Exception:
+                return None, None
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            return list(pool.map(best, ytids))
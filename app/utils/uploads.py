@@ -0,0 +1,58 @@
+import hashlib
+import os
+import shutil
+
+import pandas as pd
+import streamlit as st
+
+from utils import columnar
+from utils.csv_stream import OnlineStats, read_csv_chunks
+from utils.paths import cache_dir
+
+
+def upload_digest(uploaded_file):
+    """Content hash of an uploaded file, computed once per upload."""
+    digests = st.session_state.setdefault("_upload_digests", {})
+    if uploaded_file.file_id not in digests:
+        digests[uploaded_file.file_id] = hashlib.sha256(
+            uploaded_file.getbuffer()
+        ).hexdigest()
+    return digests[uploaded_file.file_id]
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _open_upload(digest):
+    # Opened once per content and process, so every rerun reuses the same
+    # mapped frame instead of opening the files again.
+    path = cache_dir("uploads") / digest
+    return columnar.read_frame(path), pd.read_pickle(path / "describe.pkl")
+
+
+def load_csv_upload(uploaded_file, on_chunk=None):
+    """Return an uploaded CSV as a memory-mapped frame and its statistics.
+
+    The first time some content is seen it is parsed in chunks and written
+    to the local cache, keyed by its hash; `on_chunk(chunk, stats)` is called
+    as parsing progresses. Later calls, from any session, just reopen the
+    cached files, and every rerun reuses the opened frame, which is shared
+    and must not be mutated.
+    """
+    digest = upload_digest(uploaded_file)
+    path = cache_dir("uploads") / digest
+    if not columnar.exists(path):
+        tmp = path.with_name(f"{digest}.{os.getpid()}.tmp")
+        stats = OnlineStats()
+        uploaded_file.seek(0)
+        with columnar.ColumnarWriter(tmp) as writer:
+            for chunk in read_csv_chunks(uploaded_file):
+                writer.append(chunk)
+                stats.update(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk, stats)
+        stats.describe().to_pickle(tmp / "describe.pkl")
+        try:
+            tmp.rename(path)
+        except OSError:
+            # Another session cached the same content first.
+            shutil.rmtree(tmp, ignore_errors=True)
+    return _open_upload(digest)
@@ -0,0 +1,155 @@
+import ast
+import operator
+
+import numpy as np
+import streamlit as st
+
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+_CONNECTIVES = {
+    ast.And: np.logical_and,
+    ast.Or: np.logical_or,
+    ast.BitAnd: np.logical_and,
+    ast.BitOr: np.logical_or,
+}
+
+
+def filter_mask(df, query):
+    """Boolean mask of the rows of `df` matching `query`.
+
+    Filters come from the browser, so they are parsed rather than evaluated:
+    only column names, literals, comparisons and `and`/`or`/`not` (or
+    `&`/`|`/`~`) are accepted.
+    """
+    try:
+        tree = ast.parse(query, mode="eval").body
+    except SyntaxError as e:
+        raise ValueError(f"cannot parse {query!r}") from e
+
+    def operand(node):
+        if isinstance(node, ast.Name):
+            if node.id not in df.columns:
+                raise ValueError(f"unknown column {node.id!r}")
+            return df[node.id].to_numpy()
+        if isinstance(node, ast.Constant) and isinstance(
+            node.value, (int, float, str, bool)
+        ):
+            return node.value
+        if (
+            isinstance(node, ast.UnaryOp)
+            and isinstance(node.op, ast.USub)
+            and isinstance(node.operand, ast.Constant)
+            and isinstance(node.operand.value, (int, float))
+        ):
+            return -node.operand.value
+        raise ValueError("expected a column name or a literal")
+
+    def mask(node):
+        if isinstance(node, ast.BoolOp):
+            combine = _CONNECTIVES[type(node.op)]
+            return combine.reduce([mask(value) for value in node.values])
+        if isinstance(node, ast.BinOp) and type(node.op) in _CONNECTIVES:
+            return _CONNECTIVES[type(node.op)](mask(node.left), mask(node.right))
+        if isinstance(node, ast.UnaryOp) and isinstance(
+            node.op, (ast.Not, ast.Invert)
+        ):
+            return ~mask(node.operand)
+        if isinstance(node, ast.Compare):
+            result = np.ones(len(df), dtype=bool)
+            left = operand(node.left)
+            for op, right in zip(node.ops, node.comparators):
+                if type(op) not in _COMPARISONS:
+                    raise ValueError("unsupported comparison")
+                right = operand(right)
+                compared = np.asarray(_COMPARISONS[type(op)](left, right))
+                if compared.dtype != bool:
+                    raise ValueError("comparison did not give true/false values")
+                result &= compared
+                left = right
+            return result
+        if isinstance(node, ast.Name):
+            values = operand(node)
+            if values.dtype != bool:
+                raise ValueError(f"column {node.id!r} is not boolean")
+            return values
+        raise ValueError("expected comparisons joined by and/or")
+
+    result = mask(tree)
+    if not isinstance(result, np.ndarray) or result.shape != (len(df),):
+        raise ValueError("the filter does not select rows")
+    return result
+
+
+@st.cache_resource(max_entries=8)
+def _row_order(_df, key, version, query, sort_by, ascending):
+    # Positions of the rows to show, in display order. Kept on the server so
+    # each scroll only slices a window out of the frame.
+    if not query and not sort_by:
+        return None
+    rows = np.arange(len(_df))
+    if query:
+        rows = np.flatnonzero(filter_mask(_df, query))
+    if sort_by:
+        values = _df[sort_by].to_numpy()[rows]
+        order = np.argsort(values, kind="stable")
+        rows = rows[order if ascending else order[::-1]]
+    return rows
+
+
+@st.cache_resource(max_entries=8)
+def _summary(_df, key, version):
+    return _df.describe()
+
+
+def dataframe_viewer(df, key, version=None, page_size=100, summary=None):
+    """Show a window of `df` without sending the whole frame to the browser.
+
+    `key` names the viewer's widgets and, together with `version`, identifies
+    the frame for server-side caching; bump `version` whenever the contents
+    change. Pass `summary` to show precomputed statistics instead of
+    `df.describe()`.
+    """
+    with st.container(border=True):
+        st.caption(f"{len(df):,} rows x {len(df.columns)} columns")
+        with st.expander("Summary statistics"):
+            if summary is None:
+                summary = _summary(df, key, version)
+            st.dataframe(summary)
+
+        c1, c2, c3 = st.columns([3, 2, 1])
+        query = c1.text_input(
+            "Filter", key=f"{key}_query", placeholder="e.g. a > 0.5 and b < 0.1"
+        )
+        sort_by = c2.selectbox(
+            "Sort by", [None, *df.columns], key=f"{key}_sort_by"
+        )
+        ascending = c3.toggle("Ascending", True, key=f"{key}_ascending")
+
+        try:
+            rows = _row_order(df, key, version, query.strip(), sort_by, ascending)
+        except Exception as e:
+            st.error(f"Invalid filter: {e}")
+            return
+
+        total = len(df) if rows is None else len(rows)
+        pages = max(1, -(-total // page_size))
+        if st.session_state.get(f"{key}_page", 1) > pages:
+            st.session_state[f"{key}_page"] = pages
+        page = st.number_input(
+            f"Page (of {pages:,})", 1, pages, 1, key=f"{key}_page"
+        )
+        start = (page - 1) * page_size
+        if rows is None:
+            window = df.iloc[start : start + page_size]
+        else:
+            window = df.iloc[rows[start : start + page_size]]
+        st.dataframe(window, width="stretch")
+        st.caption(
+            f"Showing rows {start + 1:,}-{start + len(window):,} of {total:,}"
+        )
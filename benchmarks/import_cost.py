@@ -0,0 +1,81 @@
+"""Measure the import cost of every page of the app.
+
+Each page gets a cold first run with `AppTest` in a fresh interpreter, after
+Streamlit itself has been imported. The time and extra resident memory of
+that run are reported, with the modules it loaded, so imports done lazily
+inside functions count too:
+
+    python benchmarks/import_cost.py [--json results.json] [--repeat 3] [--timeout 60]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+APP = Path(__file__).resolve().parent.parent / "app"
+
+PROBE = """
+import json, resource, sys, time
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+before, base_rss, start = set(sys.modules), rss(), time.perf_counter()
+AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2])).run()
+seconds, extra = time.perf_counter() - start, rss() - base_rss
+loaded = {name.partition(".")[0] for name in set(sys.modules) - before}
+print(json.dumps({"seconds": seconds, "rss": extra, "modules": sorted(loaded)}))
+"""
+
+
+def measure(path, timeout):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, str(path), str(timeout)],
+        cwd=APP,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--json", type=Path, help="also write results here")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=60, help="per page run")
+    args = parser.parse_args()
+
+    results = {}
+    for path in [APP / "main.py", *sorted((APP / "app_pages").glob("*.py"))]:
+        runs = [measure(path, args.timeout) for _ in range(args.repeat)]
+        errors = [run["error"] for run in runs if "error" in run]
+        name = str(path.relative_to(APP))
+        if errors:
+            results[name] = {"error": errors[0]}
+            print(f"{name:32} error: {errors[0]}")
+            continue
+        results[name] = {
+            "seconds": statistics.median(run["seconds"] for run in runs),
+            "rss_mb": statistics.median(run["rss"] for run in runs) / 2**20,
+            "modules": runs[0]["modules"],
+        }
+        print(
+            f"{name:32} {results[name]['seconds'] * 1000:8.1f} ms"
+            f" {results[name]['rss_mb']:8.1f} MB"
+            f" {len(results[name]['modules']):4} packages"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Load test of the Day 22 order queue.
+
+Submits orders from several threads at once (as concurrent sessions would)
+into a throwaway database and reports submit and storage throughput and the
+submit-to-commit latency:
+
+    python benchmarks/order_intake.py [--orders 50000] [--threads 8]
+
+Submits beyond the queue's backlog limit are rejected and counted.
+"""
+
+import argparse
+import queue
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+APP = Path(__file__).resolve().parent.parent / "app"
+
+ORDER = {
+    "bean": "Arabica",
+    "roast": "Medium",
+    "brewing": "Drip",
+    "serving": "Hot",
+    "milk": "Low",
+    "own_cup": False,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(APP))
+    from utils.orders import OrderQueue
+
+    with tempfile.TemporaryDirectory() as directory:
+        orders = OrderQueue(Path(directory) / "orders.db", batch_size=args.batch_size)
+        rejected = []
+
+        def submit(count):
+            full = 0
+            for _ in range(count):
+                try:
+                    orders.submit(ORDER)
+                except queue.Full:
+                    full += 1
+            rejected.append(full)
+
+        per_thread = args.orders // args.threads
+        threads = [
+            threading.Thread(target=submit, args=(per_thread,))
+            for _ in range(args.threads)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        submitted = time.perf_counter() - start
+        orders.flush()
+        stored = time.perf_counter() - start
+        metrics = orders.metrics(window=stored + 1)
+
+    total = metrics["written"]
+    print(f"submits     {total / submitted:12,.0f} /s ({sum(rejected):,} rejected)")
+    print(f"stored      {total / stored:12,.0f} /s in {metrics['batches']:,} commits")
+    print(f"latency p50 {metrics['p50_ms']:12,.1f} ms")
+    print(f"latency p99 {metrics['p99_ms']:12,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
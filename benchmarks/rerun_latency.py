@@ -0,0 +1,208 @@
+"""Headless rerun benchmark for the app's pages.
+
+Every page is run with Streamlit's `AppTest`: once cold, then through a
+scripted sequence of widget interactions repeated a number of times. Rerun
+latency percentiles, peak Python memory and the size of the rendered
+elements are written as JSON, and compared against a baseline if given:
+
+    python benchmarks/rerun_latency.py --out results.json
+    python benchmarks/rerun_latency.py --baseline results.json --tolerance 1.5
+
+Pages that call web services are switched to the local stand-ins, and the
+app runs on a private, temporary cache seeded with a stand-in for the dataset
+Day 28 would download.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+APP = Path(__file__).resolve().parent.parent / "app"
+
+# Steps applied to a page before each warm rerun, in a cycle. Pages that are
+# not listed are simply rerun.
+SCENARIOS = {
+    "app_pages/02_Day_3.py": [lambda at: at.button[0].click()],
+    "app_pages/03_Day_5.py": [
+        lambda at: at.select_slider[0].set_value(100_000),
+        lambda at: at.radio[0].set_value("sample"),
+        lambda at: at.select_slider[0].set_value(200),
+    ],
+    "app_pages/04_Day_8.py": [
+        lambda at: at.slider[0].set_value(40),
+        lambda at: at.slider[1].set_value((10.0, 90.0)),
+        lambda at: at.slider[0].set_value(25),
+    ],
+    "app_pages/06_Day_10.py": [lambda at: at.selectbox[0].set_value("Red")],
+    "app_pages/07_Day_11.py": [lambda at: at.multiselect[0].select("Green")],
+    "app_pages/08_Day_12.py": [lambda at: at.checkbox[1].check()],
+    "app_pages/11_Day_16.py": [lambda at: at.sidebar.slider[0].set_value(7)],
+    "app_pages/14_Day_19.py": [
+        lambda at: at.sidebar.text_input[0].input("Ada"),
+        lambda at: at.sidebar.selectbox[1].set_value("Pizza"),
+    ],
+    "app_pages/16_Day_22.py": [
+        lambda at: at.selectbox[0].set_value("Robusta"),
+        lambda at: at.button[0].click(),
+    ],
+    "app_pages/17_Day_23.py": [],
+    "app_pages/19_Day_25.py": [
+        lambda at: at.number_input(key="lbs").set_value(10.0),
+        lambda at: at.number_input(key="kg").set_value(3.0),
+    ],
+    "app_pages/20_Day_26.py": [
+        lambda at: at.sidebar.selectbox[0].set_value("music"),
+        lambda at: at.sidebar.selectbox[0].set_value("cooking"),
+    ],
+    "app_pages/23_Day_30.py": [
+        lambda at: at.sidebar.selectbox[0].set_value("High"),
+        lambda at: at.text_input[0].input("https://youtu.be/vIQQR_yq-8I"),
+    ],
+}
+
+# Applied once, before the cold run.
+SETUP = {
+    "app_pages/12_Day_17.py": lambda at: at.secrets.update(message="Hello!"),
+    "app_pages/17_Day_23.py": lambda at: at.query_params.update(
+        firstname="Jack", surname="Beanstalk"
+    ),
+}
+
+
+def use_standins(cache):
+    """Point the pages that call web services at the local stand-ins."""
+    # Before anything reads it: stand-in data must never reach the real cache.
+    os.environ["SANDBOX_CACHE_DIR"] = cache
+    from utils import artifacts, standins
+
+    base_url = standins.serve()
+    os.environ["BORED_API_URL"] = base_url
+    os.environ["YT_IMG_URL"] = f"{base_url}/vi"
+    os.environ["PENGUINS_URL"] = f"{base_url}/penguins_cleaned.csv"
+    artifacts.stored_dataset("adult", standins.adult)
+    artifacts.stored_dataset("adult-display", lambda: standins.adult(display=True))
+
+
+def rendered_size(at):
+    """Serialized size of all elements the last run rendered.
+
+    Every element counts, whether or not it changed since the previous run.
+    """
+
+    def walk(node):
+        proto = getattr(node, "proto", None)
+        size = proto.ByteSize() if hasattr(proto, "ByteSize") else 0
+        return size + sum(walk(c) for c in getattr(node, "children", {}).values())
+
+    return walk(at._tree)
+
+
+def run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def bench_page(name, reruns, timeout):
+    at = AppTest.from_file(str(APP / name), default_timeout=timeout)
+    if name in SETUP:
+        SETUP[name](at)
+    cold = run(at)
+
+    steps = SCENARIOS.get(name) or [lambda at: None]
+    warm, rendered = [], []
+    for i in range(reruns):
+        steps[i % len(steps)](at)
+        warm.append(run(at))
+        rendered.append(rendered_size(at))
+
+    # A separate pass, since tracing slows the runs being timed.
+    tracemalloc.start()
+    for step in steps:
+        step(at)
+        run(at)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    warm_ms = np.array(warm) * 1000
+    return {
+        "cold_ms": cold * 1000,
+        "warm_p50_ms": float(np.percentile(warm_ms, 50)),
+        "warm_p95_ms": float(np.percentile(warm_ms, 95)),
+        "warm_max_ms": float(warm_ms.max()),
+        "peak_memory_mb": peak / 2**20,
+        "rendered_bytes": int(np.median(rendered)),
+    }
+
+
+def regressions(results, baseline, tolerance):
+    for name, result in results.items():
+        before = baseline.get(name, {})
+        for metric in ("warm_p95_ms", "peak_memory_mb", "rendered_bytes"):
+            if metric in result and metric in before:
+                if result[metric] > before[metric] * tolerance:
+                    change = f"{before[metric]:.1f} -> {result[metric]:.1f}"
+                    yield f"{name}: {metric} {change}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("pages", nargs="*", help="pages to run (default: all)")
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--out", type=Path, help="write results here")
+    parser.add_argument("--baseline", type=Path, help="results to compare to")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(APP))
+    cache = tempfile.TemporaryDirectory(prefix="sandbox-benchmark-")
+    use_standins(cache.name)
+    names = args.pages or [
+        "main.py",
+        *(str(p.relative_to(APP)) for p in sorted((APP / "app_pages").glob("*.py"))),
+    ]
+    # Pages that stream or poll forever can't be driven headlessly.
+    names = [name for name in names if name != "app_pages/05_Day_9.py" or args.pages]
+
+    results = {}
+    for name in names:
+        try:
+            results[name] = bench_page(name, args.reruns, args.timeout)
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+            print(f"{name:28} error: {results[name]['error']}")
+            continue
+        r = results[name]
+        print(
+            f"{name:28} cold {r['cold_ms']:8.1f} ms"
+            f"  warm p50 {r['warm_p50_ms']:7.1f} ms  p95 {r['warm_p95_ms']:7.1f} ms"
+            f"  peak {r['peak_memory_mb']:6.1f} MB  rendered {r['rendered_bytes']:,} B"
+        )
+
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        failed = list(
+            regressions(results, json.loads(args.baseline.read_text()), args.tolerance)
+        )
+        for line in failed:
+            print(f"REGRESSION {line}")
+        sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()